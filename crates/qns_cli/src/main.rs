@@ -5,7 +5,8 @@
 //! - Benchmarking performance
 //! - Profiling noise characteristics
 
-use std::path::PathBuf;
+use std::io::{BufRead, Write};
+use std::path::{Path, PathBuf};
 use std::time::Instant;
 
 use anyhow::{Context, Result};
@@ -102,6 +103,20 @@ enum Commands {
         qubits: usize,
     },
 
+    /// Serve circuits from stdin (one QASM path per line) without restarting
+    ///
+    /// Each request is answered with `PARSED <n> gates`, `ROUTED <n> gates`
+    /// and `TIME <ms> ms` lines, or a single `ERROR <message>` line.
+    Serve {
+        /// Hardware topology (linear, grid, all-to-all)
+        #[arg(short, long, default_value = "linear")]
+        topology: String,
+
+        /// Weight for crosstalk-aware routing (0.0 = disabled, >0.0 = enabled)
+        #[arg(long, default_value = "0.0")]
+        crosstalk_weight: f64,
+    },
+
     /// Show system information
     Info,
 }
@@ -115,11 +130,16 @@ fn main() -> Result<()> {
     } else {
         Level::INFO
     };
-    let _ = FmtSubscriber::builder()
+    let builder = FmtSubscriber::builder()
         .with_max_level(level)
         .with_target(false)
-        .without_time()
-        .try_init();
+        .without_time();
+    // In serve mode stdout carries the response protocol, so log to stderr
+    let _ = if matches!(cli.command, Commands::Serve { .. }) {
+        builder.with_writer(std::io::stderr).try_init()
+    } else {
+        builder.try_init()
+    };
 
     match cli.command {
         Commands::Run {
@@ -148,6 +168,10 @@ fn main() -> Result<()> {
             iterations,
         } => cmd_benchmark(qubits, gates, iterations, cli.format),
         Commands::Profile { qubits } => cmd_profile(qubits, cli.format),
+        Commands::Serve {
+            topology,
+            crosstalk_weight,
+        } => cmd_serve(&topology, crosstalk_weight),
         Commands::Info => cmd_info(cli.format),
     }
 }
@@ -165,13 +189,61 @@ fn cmd_run(
     crosstalk_weight: f64,
     zne_method: &str,
 ) -> Result<()> {
-    let start = Instant::now();
-
     // Handle Qiskit backends
     if backend != "simulator" {
         return cmd_run_qiskit(input, backend, ibm_backend, shots, format);
     }
 
+    let result = run_circuit(input, topology, no_optimize, crosstalk_weight, zne_method)?;
+
+    // Output result
+    match format {
+        OutputFormat::Text => {
+            println!("\n=== QNS Run Result ===");
+            println!("Input:      {}", result.input_file);
+            println!("Topology:   {}", result.topology);
+            println!("Qubits:     {}", result.num_qubits);
+            println!();
+            println!("Parsed:     {} gates", result.original_gates);
+            println!("Routed:     {} gates", result.routed_gates);
+            println!("SWAPs:      {}", result.swap_count);
+            println!("Depth:      {}", result.circuit_depth);
+            println!();
+            println!("Fidelity Before: {:.4}", result.fidelity_before);
+            println!("Fidelity After:  {:.4}", result.fidelity_after);
+            println!("Improvement:     {:.2}%", result.improvement_percent);
+
+            // ZNE 결과 출력
+            if result.zne_method != "off" {
+                println!();
+                println!("=== ZNE (Zero-Noise Extrapolation) ===");
+                println!("Method:     {}", result.zne_method);
+                if let Some(zne_fid) = result.zne_zero_noise_fidelity {
+                    println!("Zero-Noise Fidelity: {:.4}", zne_fid);
+                }
+            }
+
+            println!();
+            println!("Time:       {:.2} ms", result.total_time_ms);
+        },
+        OutputFormat::Json => {
+            println!("{}", serde_json::to_string_pretty(&result)?);
+        },
+    }
+
+    Ok(())
+}
+
+/// Parse, optimize and (optionally) apply ZNE to a QASM circuit on the QNS simulator
+fn run_circuit(
+    input: &Path,
+    topology: &str,
+    no_optimize: bool,
+    crosstalk_weight: f64,
+    zne_method: &str,
+) -> Result<RunResult> {
+    let start = Instant::now();
+
     // Read and parse QASM file
     let qasm_content = std::fs::read_to_string(input)
         .with_context(|| format!("Failed to read QASM file: {}", input.display()))?;
@@ -306,39 +378,31 @@ fn cmd_run(
         }
     };
 
-    // Output result
-    match format {
-        OutputFormat::Text => {
-            println!("\n=== QNS Run Result ===");
-            println!("Input:      {}", result.input_file);
-            println!("Topology:   {}", result.topology);
-            println!("Qubits:     {}", result.num_qubits);
-            println!();
-            println!("Parsed:     {} gates", result.original_gates);
-            println!("Routed:     {} gates", result.routed_gates);
-            println!("SWAPs:      {}", result.swap_count);
-            println!("Depth:      {}", result.circuit_depth);
-            println!();
-            println!("Fidelity Before: {:.4}", result.fidelity_before);
-            println!("Fidelity After:  {:.4}", result.fidelity_after);
-            println!("Improvement:     {:.2}%", result.improvement_percent);
+    Ok(result)
+}
 
-            // ZNE 결과 출력
-            if result.zne_method != "off" {
-                println!();
-                println!("=== ZNE (Zero-Noise Extrapolation) ===");
-                println!("Method:     {}", result.zne_method);
-                if let Some(zne_fid) = result.zne_zero_noise_fidelity {
-                    println!("Zero-Noise Fidelity: {:.4}", zne_fid);
-                }
-            }
+/// Serve circuits from stdin until EOF, reusing one process for many runs
+fn cmd_serve(topology: &str, crosstalk_weight: f64) -> Result<()> {
+    let stdin = std::io::stdin();
+    let stdout = std::io::stdout();
+    let mut out = stdout.lock();
+
+    for line in stdin.lock().lines() {
+        let line = line.with_context(|| "Failed to read request from stdin")?;
+        let input = line.trim();
+        if input.is_empty() {
+            continue;
+        }
 
-            println!();
-            println!("Time:       {:.2} ms", result.total_time_ms);
-        },
-        OutputFormat::Json => {
-            println!("{}", serde_json::to_string_pretty(&result)?);
-        },
+        match run_circuit(Path::new(input), topology, false, crosstalk_weight, "off") {
+            Ok(result) => {
+                writeln!(out, "PARSED {} gates", result.original_gates)?;
+                writeln!(out, "ROUTED {} gates", result.routed_gates)?;
+                writeln!(out, "TIME {:.3} ms", result.total_time_ms)?;
+            },
+            Err(e) => writeln!(out, "ERROR {:#}", e)?,
+        }
+        out.flush()?;
     }
 
     Ok(())
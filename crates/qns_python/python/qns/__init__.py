@@ -54,6 +54,12 @@ from .qns import (
     convert_circuit_to_qiskit, run_aer_simulation,
 )
 
+# Newer than some local extension builds; a stale build must not break `import qns`
+try:
+    from .qns import bench_fidelity, fidelity_benchmark_cases
+except ImportError:
+    pass
+
 # make len(circuit) return number of gates
 def _circuit___len__(self):
     for attr in ("gates_count", "num_gates", "n_gates"):
@@ -143,3 +149,5 @@ __all__ = [
     "convert_circuit_to_qiskit", "run_aer_simulation",
     "ibm",
 ]
+if "bench_fidelity" in globals():
+    __all__ += ["bench_fidelity", "fidelity_benchmark_cases"]
@@ -292,6 +292,16 @@ def score_circuit(circuit: Circuit, noise: NoiseVector) -> float:
     """Scores a circuit for noise-aware optimization."""
     ...
 
+def bench_fidelity(
+    circuit: Circuit, noise: NoiseVector, runs: int = 10
+) -> List[Tuple[float, float, float, float]]:
+    """Runs the fidelity benchmark; one (baseline, optimized, improvement, time_ms) row per run."""
+    ...
+
+def fidelity_benchmark_cases() -> List[Tuple[str, Circuit, NoiseVector]]:
+    """The fidelity_benchmark circuit x noise matrix as (key, circuit, noise) cases."""
+    ...
+
 
 class convert:
     """Conversion utilities for Qiskit integration."""
@@ -15,7 +15,11 @@ use qns_core::types::{
     CircuitGenome, Gate as CoreGate, HardwareProfile as CoreHardwareProfile,
     NoiseVector as CoreNoiseVector, Topology,
 };
-use qns_rewire::{estimate_fidelity_with_idle_tracking, LiveRewirer, RewireConfig, ScoreConfig};
+use qns_rewire::{
+    estimate_fidelity_with_hardware, estimate_fidelity_with_idle_tracking,
+    fidelity_benchmark_circuits, fidelity_benchmark_noise_configs, LiveRewirer, RewireConfig,
+    ScoreConfig,
+};
 use qns_simulator::StateVectorSimulator;
 
 // ============================================================================
@@ -1347,6 +1351,91 @@ fn score_circuit(circuit: &PyCircuit, noise: &PyNoiseVector) -> f64 {
     estimate_fidelity_with_idle_tracking(&circuit.inner, &noise.inner, &score_config)
 }
 
+/// Run the fidelity benchmark for one circuit in-process.
+///
+/// Mirrors `benchmark_circuit` in the `fidelity_benchmark` example (heavy-hex
+/// hardware with injected crosstalk, hardware-aware rewiring) without going
+/// through cargo and JSON. Returns one `(baseline, optimized, improvement,
+/// time_ms)` row per run.
+#[pyfunction]
+#[pyo3(signature = (circuit, noise, runs=10))]
+fn bench_fidelity(
+    py: Python,
+    circuit: &PyCircuit,
+    noise: &PyNoiseVector,
+    runs: usize,
+) -> PyResult<Vec<(f64, f64, f64, f64)>> {
+    let circuit = circuit.inner.clone();
+    let noise = noise.inner.clone();
+
+    // Pure Rust from here on; let other Python threads run meanwhile
+    py.allow_threads(move || {
+        let score_config = ScoreConfig::default();
+        let config = RewireConfig {
+            max_variants: 100,
+            max_depth: 4,
+            min_fidelity_threshold: 0.1,
+            hardware_aware: true,
+            score_config: score_config.clone(),
+            beam_width: 20,
+            beam_search_threshold: 50,
+            parallel: true,
+            crosstalk_weight: 0.1,
+            use_sabre: true,
+        };
+
+        let mut hardware = CoreHardwareProfile::heavy_hex("benchmark_hw", 3, 5);
+        hardware.crosstalk.set_interaction(0, 1, 0.05);
+        hardware.crosstalk.set_interaction(1, 2, 0.05);
+        hardware.crosstalk.set_interaction(2, 3, 0.05);
+
+        let baseline = estimate_fidelity_with_hardware(&circuit, &noise, &hardware, &score_config);
+
+        let mut rows = Vec::with_capacity(runs);
+        for _ in 0..runs {
+            let start = std::time::Instant::now();
+            let mut rewirer = LiveRewirer::with_config(config.clone());
+            rewirer.set_hardware(hardware.clone());
+            rewirer
+                .load(circuit.clone())
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            let result = rewirer
+                .optimize_with_hardware(&noise, &hardware, config.max_variants)
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            let elapsed = start.elapsed().as_secs_f64() * 1000.0;
+
+            rows.push((baseline, result.fidelity, result.improvement, elapsed));
+        }
+
+        Ok(rows)
+    })
+}
+
+/// The circuit x noise matrix of the `fidelity_benchmark` example.
+///
+/// Returns `(key, circuit, noise)` per case, keyed `"<circuit>_<noise>"` in
+/// the example's order, so `bench_fidelity` callers run the same workloads
+/// without copying the circuit definitions.
+#[pyfunction]
+fn fidelity_benchmark_cases() -> Vec<(String, PyCircuit, PyNoiseVector)> {
+    let circuits = fidelity_benchmark_circuits();
+    let mut cases = Vec::new();
+    for (noise_name, noise) in fidelity_benchmark_noise_configs() {
+        for (circuit_name, circuit) in &circuits {
+            cases.push((
+                format!("{}_{}", circuit_name, noise_name),
+                PyCircuit {
+                    inner: circuit.clone(),
+                },
+                PyNoiseVector {
+                    inner: noise.clone(),
+                },
+            ));
+        }
+    }
+    cases
+}
+
 // ============================================================================
 // Qiskit Bridge Functions
 // ============================================================================
@@ -1481,6 +1570,8 @@ fn qns(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
 
     m.add_function(wrap_pyfunction!(estimate_circuit_fidelity, m)?)?;
     let _ = m.add_function(wrap_pyfunction!(score_circuit, m)?);
+    m.add_function(wrap_pyfunction!(bench_fidelity, m)?)?;
+    m.add_function(wrap_pyfunction!(fidelity_benchmark_cases, m)?)?;
 
     // Qiskit bridge functions
     m.add_function(wrap_pyfunction!(convert_circuit_to_qiskit, m)?)?;
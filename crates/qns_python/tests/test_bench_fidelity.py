@@ -0,0 +1,90 @@
+"""
+QNS Python Bindings - in-process fidelity benchmark tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+EXPECTED_CIRCUITS = [
+    "diagnostic_n2", "qft_n4", "ghz_n4", "random_commuting_n5", "vqe_n4", "deep_n3",
+]
+EXPECTED_NOISE = ["low_noise", "medium_noise", "high_noise"]
+
+
+@pytest.fixture(scope="module")
+def qns_bench():
+    """The qns module, skipping when the extension predates bench_fidelity."""
+    import qns
+    if not hasattr(qns, "bench_fidelity") or not hasattr(qns, "fidelity_benchmark_cases"):
+        pytest.skip("qns extension built without bench_fidelity")
+    return qns
+
+
+@pytest.fixture(scope="module")
+def statistical_validation():
+    """scripts/statistical_validation.py, imported as scripts.statistical_validation."""
+    pytest.importorskip("scipy")
+    sys.path.insert(0, str(REPO_ROOT))
+    try:
+        from scripts import statistical_validation
+    finally:
+        sys.path.remove(str(REPO_ROOT))
+    return statistical_validation
+
+
+class TestFidelityBenchmarkCases:
+    """Test the circuit x noise matrix shared with the fidelity_benchmark example."""
+
+    def test_case_keys(self, qns_bench):
+        keys = [key for key, _, _ in qns_bench.fidelity_benchmark_cases()]
+        assert keys == [f"{c}_{n}" for n in EXPECTED_NOISE for c in EXPECTED_CIRCUITS]
+
+    def test_case_types(self, qns_bench):
+        for _, circuit, noise in qns_bench.fidelity_benchmark_cases():
+            assert isinstance(circuit, qns_bench.Circuit)
+            assert isinstance(noise, qns_bench.NoiseVector)
+            assert len(circuit) > 0
+
+    def test_noise_configs(self, qns_bench):
+        t1t2 = {}
+        for key, _, noise in qns_bench.fidelity_benchmark_cases():
+            noise_name = next(n for n in EXPECTED_NOISE if key.endswith(n))
+            t1t2[noise_name] = (noise.t1, noise.t2)
+        assert t1t2 == {
+            "low_noise": (300.0, 200.0),
+            "medium_noise": (100.0, 80.0),
+            "high_noise": (50.0, 40.0),
+        }
+
+
+class TestBenchFidelity:
+    """Test bench_fidelity and the statistical_validation path built on it."""
+
+    def test_bench_fidelity_rows(self, qns_bench):
+        _, circuit, noise = qns_bench.fidelity_benchmark_cases()[0]
+        rows = qns_bench.bench_fidelity(circuit, noise, runs=3)
+        assert len(rows) == 3
+        for baseline, optimized, _, time_ms in rows:
+            assert 0.0 <= baseline <= 1.0
+            assert 0.0 <= optimized <= 1.0
+            assert time_ms >= 0.0
+        # The baseline is estimated once, before the timed runs
+        assert len({row[0] for row in rows}) == 1
+
+    def test_run_rust_benchmark_in_process(self, qns_bench, statistical_validation, monkeypatch):
+        def no_cargo(*args, **kwargs):
+            raise AssertionError("run_rust_benchmark fell back to cargo")
+
+        monkeypatch.setattr(statistical_validation.subprocess, "run", no_cargo)
+        results = statistical_validation.run_rust_benchmark(runs=2)
+
+        assert list(results) == [key for key, _, _ in qns_bench.fidelity_benchmark_cases()]
+        for columns in results.values():
+            assert set(columns) == {"baseline", "optimized", "improvement", "time_ms"}
+            assert all(len(v) == 2 for v in columns.values())
+
+        analyzed = statistical_validation.analyze_circuits(results)
+        assert [r.circuit_name for r in analyzed] == list(results)
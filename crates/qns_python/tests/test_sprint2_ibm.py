@@ -48,6 +48,7 @@ def test_ibm_connection():
         backends_to_try = ['ibm_fez', 'ibm_kyoto', 'ibm_osaka']
         
         connected_backend = None
+        last_error = None
         for backend_name in backends_to_try:
             try:
                 print(f"    Trying backend: {backend_name}...")
@@ -56,10 +57,13 @@ def test_ibm_connection():
                 print(f"    ✅ Connected to {backend_name}")
                 break
             except Exception as e:
-                print(f"    ❌ {backend_name} not available: {e}")
-                continue
+                # Keep per-backend failures cheap; details only if all fail
+                print(f"    ❌ {backend_name}: {type(e).__name__}")
+                last_error = e
         
         if not connected_backend:
+            if last_error is not None:
+                print(f"    Last error: {last_error}")
             print("\n⚠️ No backends available. Using simulator for testing.")
             return None
         
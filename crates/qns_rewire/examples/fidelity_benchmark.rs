@@ -9,7 +9,10 @@
 //!   cargo run --release --example fidelity_benchmark -- --runs 100
 
 use qns_core::prelude::*;
-use qns_rewire::{estimate_fidelity_with_hardware, LiveRewirer, RewireConfig, ScoreConfig};
+use qns_rewire::{
+    estimate_fidelity_with_hardware, fidelity_benchmark_circuits, fidelity_benchmark_noise_configs,
+    LiveRewirer, RewireConfig, ScoreConfig,
+};
 use std::time::Instant;
 
 /// Benchmark result for a single circuit
@@ -27,144 +30,6 @@ struct BenchmarkResult {
     strategy: String,
 }
 
-/// Generate standard benchmark circuits
-fn generate_benchmark_circuits() -> Vec<(String, CircuitGenome)> {
-    vec![
-        // 1. Simple diagnostic circuit - verify reordering works
-        ("diagnostic_n2".to_string(), create_diagnostic_circuit()),
-        // 2. QFT-like circuit (4 qubits)
-        ("qft_n4".to_string(), create_qft_circuit(4)),
-        // 3. GHZ state preparation (4 qubits)
-        ("ghz_n4".to_string(), create_ghz_circuit(4)),
-        // 4. Random circuit with commuting gates (5 qubits)
-        (
-            "random_commuting_n5".to_string(),
-            create_random_commuting_circuit(5, 20),
-        ),
-        // 5. Variational circuit (VQE-like, 4 qubits)
-        ("vqe_n4".to_string(), create_vqe_circuit(4, 2)),
-        // 6. Deep circuit with many layers (3 qubits)
-        ("deep_n3".to_string(), create_deep_circuit(3, 10)),
-    ]
-}
-
-/// Diagnostic circuit to verify reordering generates variants
-/// H(0), H(1), Z(0), Z(1) - all gates on different qubits commute
-fn create_diagnostic_circuit() -> CircuitGenome {
-    let mut circuit = CircuitGenome::new(2);
-    circuit.add_gate(Gate::H(0)).unwrap();
-    circuit.add_gate(Gate::H(1)).unwrap();
-    circuit.add_gate(Gate::Z(0)).unwrap();
-    circuit.add_gate(Gate::Z(1)).unwrap();
-    circuit
-}
-
-/// Create QFT-like circuit
-fn create_qft_circuit(n: usize) -> CircuitGenome {
-    let mut circuit = CircuitGenome::new(n);
-
-    for i in 0..n {
-        circuit.add_gate(Gate::H(i)).unwrap();
-        for j in (i + 1)..n {
-            // Controlled rotation (simplified as CZ)
-            circuit.add_gate(Gate::CZ(i, j)).unwrap();
-        }
-    }
-
-    // SWAP network for bit reversal
-    for i in 0..(n / 2) {
-        circuit.add_gate(Gate::SWAP(i, n - 1 - i)).unwrap();
-    }
-
-    circuit
-}
-
-/// Create GHZ state preparation circuit
-fn create_ghz_circuit(n: usize) -> CircuitGenome {
-    let mut circuit = CircuitGenome::new(n);
-
-    circuit.add_gate(Gate::H(0)).unwrap();
-    for i in 1..n {
-        circuit.add_gate(Gate::CNOT(0, i)).unwrap();
-    }
-
-    circuit
-}
-
-/// Create random circuit with commuting gates
-fn create_random_commuting_circuit(n: usize, gates: usize) -> CircuitGenome {
-    let mut circuit = CircuitGenome::new(n);
-
-    for i in 0..gates {
-        let q = i % n;
-        match i % 4 {
-            0 => circuit.add_gate(Gate::H(q)).unwrap(),
-            1 => circuit.add_gate(Gate::Z(q)).unwrap(),
-            2 => circuit.add_gate(Gate::T(q)).unwrap(),
-            _ => circuit.add_gate(Gate::S(q)).unwrap(),
-        }
-    }
-
-    // Add some 2-qubit gates
-    for i in 0..(n - 1) {
-        circuit.add_gate(Gate::CNOT(i, i + 1)).unwrap();
-    }
-
-    circuit
-}
-
-/// Create VQE-like variational circuit
-fn create_vqe_circuit(n: usize, layers: usize) -> CircuitGenome {
-    let mut circuit = CircuitGenome::new(n);
-
-    for _ in 0..layers {
-        // Rotation layer
-        for q in 0..n {
-            circuit
-                .add_gate(Gate::Ry(q, std::f64::consts::PI / 4.0))
-                .unwrap();
-            circuit
-                .add_gate(Gate::Rz(q, std::f64::consts::PI / 3.0))
-                .unwrap();
-        }
-
-        // Entanglement layer
-        for q in 0..(n - 1) {
-            circuit.add_gate(Gate::CNOT(q, q + 1)).unwrap();
-        }
-    }
-
-    circuit
-}
-
-/// Create deep circuit with many layers
-fn create_deep_circuit(n: usize, depth: usize) -> CircuitGenome {
-    let mut circuit = CircuitGenome::new(n);
-
-    for layer in 0..depth {
-        for q in 0..n {
-            match layer % 3 {
-                0 => circuit.add_gate(Gate::H(q)).unwrap(),
-                1 => circuit.add_gate(Gate::T(q)).unwrap(),
-                _ => circuit.add_gate(Gate::S(q)).unwrap(),
-            }
-        }
-
-        // Alternating CNOT pattern
-        if layer % 2 == 0 {
-            for q in (0..n - 1).step_by(2) {
-                circuit.add_gate(Gate::CNOT(q, q + 1)).unwrap();
-            }
-        } else {
-            for q in (1..n - 1).step_by(2) {
-                circuit.add_gate(Gate::CNOT(q, q + 1)).unwrap();
-            }
-        }
-    }
-
-    circuit
-}
-
 /// Run benchmark on a single circuit
 fn benchmark_circuit(
     name: &str,
@@ -227,14 +92,9 @@ fn benchmark_circuit(
 
 /// Run all benchmarks with multiple noise configurations
 fn run_benchmarks(num_runs: usize) -> Vec<BenchmarkResult> {
-    let circuits = generate_benchmark_circuits();
-
-    // Different noise configurations (IBM Heron-like)
-    let noise_configs = vec![
-        ("low_noise", NoiseVector::with_t1t2(0, 300.0, 200.0)),
-        ("medium_noise", NoiseVector::with_t1t2(0, 100.0, 80.0)),
-        ("high_noise", NoiseVector::with_t1t2(0, 50.0, 40.0)),
-    ];
+    // Shared with the Python bindings (qns.fidelity_benchmark_cases)
+    let circuits = fidelity_benchmark_circuits();
+    let noise_configs = fidelity_benchmark_noise_configs();
 
     let config = RewireConfig {
         max_variants: 100,
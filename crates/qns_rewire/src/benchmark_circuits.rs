@@ -0,0 +1,178 @@
+//! Benchmark circuit sets shared by the examples and the Python bindings
+//!
+//! The fidelity benchmark circuits and noise configurations live here so the
+//! `fidelity_benchmark` example and `qns.bench_fidelity` callers run exactly
+//! the same workloads.
+
+use qns_core::prelude::*;
+
+/// Circuits of the fidelity comparison benchmark, in reporting order
+pub fn fidelity_benchmark_circuits() -> Vec<(String, CircuitGenome)> {
+    vec![
+        // 1. Simple diagnostic circuit - verify reordering works
+        ("diagnostic_n2".to_string(), create_diagnostic_circuit()),
+        // 2. QFT-like circuit (4 qubits)
+        ("qft_n4".to_string(), create_qft_circuit(4)),
+        // 3. GHZ state preparation (4 qubits)
+        ("ghz_n4".to_string(), create_ghz_circuit(4)),
+        // 4. Random circuit with commuting gates (5 qubits)
+        (
+            "random_commuting_n5".to_string(),
+            create_random_commuting_circuit(5, 20),
+        ),
+        // 5. Variational circuit (VQE-like, 4 qubits)
+        ("vqe_n4".to_string(), create_vqe_circuit(4, 2)),
+        // 6. Deep circuit with many layers (3 qubits)
+        ("deep_n3".to_string(), create_deep_circuit(3, 10)),
+    ]
+}
+
+/// Noise configurations of the fidelity comparison benchmark (IBM Heron-like)
+pub fn fidelity_benchmark_noise_configs() -> Vec<(&'static str, NoiseVector)> {
+    vec![
+        ("low_noise", NoiseVector::with_t1t2(0, 300.0, 200.0)),
+        ("medium_noise", NoiseVector::with_t1t2(0, 100.0, 80.0)),
+        ("high_noise", NoiseVector::with_t1t2(0, 50.0, 40.0)),
+    ]
+}
+
+/// Diagnostic circuit to verify reordering generates variants
+/// H(0), H(1), Z(0), Z(1) - all gates on different qubits commute
+fn create_diagnostic_circuit() -> CircuitGenome {
+    let mut circuit = CircuitGenome::new(2);
+    circuit.add_gate(Gate::H(0)).unwrap();
+    circuit.add_gate(Gate::H(1)).unwrap();
+    circuit.add_gate(Gate::Z(0)).unwrap();
+    circuit.add_gate(Gate::Z(1)).unwrap();
+    circuit
+}
+
+/// Create QFT-like circuit
+fn create_qft_circuit(n: usize) -> CircuitGenome {
+    let mut circuit = CircuitGenome::new(n);
+
+    for i in 0..n {
+        circuit.add_gate(Gate::H(i)).unwrap();
+        for j in (i + 1)..n {
+            // Controlled rotation (simplified as CZ)
+            circuit.add_gate(Gate::CZ(i, j)).unwrap();
+        }
+    }
+
+    // SWAP network for bit reversal
+    for i in 0..(n / 2) {
+        circuit.add_gate(Gate::SWAP(i, n - 1 - i)).unwrap();
+    }
+
+    circuit
+}
+
+/// Create GHZ state preparation circuit
+fn create_ghz_circuit(n: usize) -> CircuitGenome {
+    let mut circuit = CircuitGenome::new(n);
+
+    circuit.add_gate(Gate::H(0)).unwrap();
+    for i in 1..n {
+        circuit.add_gate(Gate::CNOT(0, i)).unwrap();
+    }
+
+    circuit
+}
+
+/// Create random circuit with commuting gates
+fn create_random_commuting_circuit(n: usize, gates: usize) -> CircuitGenome {
+    let mut circuit = CircuitGenome::new(n);
+
+    for i in 0..gates {
+        let q = i % n;
+        match i % 4 {
+            0 => circuit.add_gate(Gate::H(q)).unwrap(),
+            1 => circuit.add_gate(Gate::Z(q)).unwrap(),
+            2 => circuit.add_gate(Gate::T(q)).unwrap(),
+            _ => circuit.add_gate(Gate::S(q)).unwrap(),
+        }
+    }
+
+    // Add some 2-qubit gates
+    for i in 0..(n - 1) {
+        circuit.add_gate(Gate::CNOT(i, i + 1)).unwrap();
+    }
+
+    circuit
+}
+
+/// Create VQE-like variational circuit
+fn create_vqe_circuit(n: usize, layers: usize) -> CircuitGenome {
+    let mut circuit = CircuitGenome::new(n);
+
+    for _ in 0..layers {
+        // Rotation layer
+        for q in 0..n {
+            circuit
+                .add_gate(Gate::Ry(q, std::f64::consts::PI / 4.0))
+                .unwrap();
+            circuit
+                .add_gate(Gate::Rz(q, std::f64::consts::PI / 3.0))
+                .unwrap();
+        }
+
+        // Entanglement layer
+        for q in 0..(n - 1) {
+            circuit.add_gate(Gate::CNOT(q, q + 1)).unwrap();
+        }
+    }
+
+    circuit
+}
+
+/// Create deep circuit with many layers
+fn create_deep_circuit(n: usize, depth: usize) -> CircuitGenome {
+    let mut circuit = CircuitGenome::new(n);
+
+    for layer in 0..depth {
+        for q in 0..n {
+            match layer % 3 {
+                0 => circuit.add_gate(Gate::H(q)).unwrap(),
+                1 => circuit.add_gate(Gate::T(q)).unwrap(),
+                _ => circuit.add_gate(Gate::S(q)).unwrap(),
+            }
+        }
+
+        // Alternating CNOT pattern
+        if layer % 2 == 0 {
+            for q in (0..n - 1).step_by(2) {
+                circuit.add_gate(Gate::CNOT(q, q + 1)).unwrap();
+            }
+        } else {
+            for q in (1..n - 1).step_by(2) {
+                circuit.add_gate(Gate::CNOT(q, q + 1)).unwrap();
+            }
+        }
+    }
+
+    circuit
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_fidelity_benchmark_circuit_set() {
+        let circuits = fidelity_benchmark_circuits();
+        let names: Vec<&str> = circuits.iter().map(|(name, _)| name.as_str()).collect();
+        assert_eq!(
+            names,
+            [
+                "diagnostic_n2",
+                "qft_n4",
+                "ghz_n4",
+                "random_commuting_n5",
+                "vqe_n4",
+                "deep_n3"
+            ]
+        );
+        assert_eq!(circuits[0].1.gates.len(), 4);
+        assert_eq!(fidelity_benchmark_noise_configs().len(), 3);
+    }
+}
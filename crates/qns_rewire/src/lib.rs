@@ -1,6 +1,7 @@
 //! QNS Rewire - skeleton lib.rs
 //! NOTE: Replace contents with full implementation as in your spec.
 
+pub mod benchmark_circuits;
 pub mod details;
 pub mod gate_reorder;
 pub mod graph;
@@ -8,6 +9,7 @@ pub mod live_rewirer;
 pub mod router;
 pub mod scoring;
 
+pub use benchmark_circuits::{fidelity_benchmark_circuits, fidelity_benchmark_noise_configs};
 pub use gate_reorder::{
     estimate_circuit_error, score_circuit_variant, BeamSearchConfig, CommutingPair, GateReorder,
     ReorderAnalysis, ReorderConfig,
@@ -12,16 +12,27 @@ Analyzes contribution of each component:
 Usage:
     python ablation_study.py
     python ablation_study.py --output ablation_results.json
+    python ablation_study.py --output ablation_results.json --compact
 """
 
+import sys
 import json
 import argparse
 import numpy as np
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import List, Dict
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit  # Optional (see requirements.txt)
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 @dataclass
 class AblationResult:
     """Result for a single ablation configuration"""
@@ -43,35 +54,101 @@ class CircuitAblation:
     placement_only: float
     full_pipeline: float
 
+    reorder_contribution: float = field(init=False)
+    scoring_contribution: float = field(init=False)
+    placement_contribution: float = field(init=False)
+    synergy: float = field(init=False)
+
+    def __post_init__(self):
+        self.reorder_contribution = self.reorder_only - self.baseline
+        self.scoring_contribution = self.scoring_only - self.baseline
+        self.placement_contribution = self.placement_only - self.baseline
+        # Synergy = Full - (sum of individual contributions)
+        individual_sum = (self.reorder_contribution +
+                         self.scoring_contribution +
+                         self.placement_contribution)
+        self.synergy = (self.full_pipeline - self.baseline) - individual_sum
+
+
+@dataclass
+class AblationTable:
+    """Column-oriented ablation results (one array per configuration)"""
+    names: List[str]
+    num_qubits: np.ndarray
+    num_gates: np.ndarray
+    baseline: np.ndarray
+    reorder_only: np.ndarray
+    scoring_only: np.ndarray
+    placement_only: np.ndarray
+    full_pipeline: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
     @property
-    def reorder_contribution(self) -> float:
+    def reorder_contribution(self) -> np.ndarray:
         return self.reorder_only - self.baseline
 
     @property
-    def scoring_contribution(self) -> float:
+    def scoring_contribution(self) -> np.ndarray:
         return self.scoring_only - self.baseline
 
     @property
-    def placement_contribution(self) -> float:
+    def placement_contribution(self) -> np.ndarray:
         return self.placement_only - self.baseline
 
     @property
-    def synergy(self) -> float:
+    def full_improvement(self) -> np.ndarray:
+        return self.full_pipeline - self.baseline
+
+    @property
+    def synergy(self) -> np.ndarray:
         """Synergy = Full - (sum of individual contributions)"""
         individual_sum = (self.reorder_contribution +
                          self.scoring_contribution +
                          self.placement_contribution)
-        return (self.full_pipeline - self.baseline) - individual_sum
+        return self.full_improvement - individual_sum
+
+    def to_records(self) -> List[CircuitAblation]:
+        """Convert back to per-circuit CircuitAblation records"""
+        return [
+            CircuitAblation(*row)
+            for row in zip(self.names,
+                           self.num_qubits.tolist(),
+                           self.num_gates.tolist(),
+                           self.baseline.tolist(),
+                           self.reorder_only.tolist(),
+                           self.scoring_only.tolist(),
+                           self.placement_only.tolist(),
+                           self.full_pipeline.tolist())
+        ]
+
+
+@njit(cache=True)
+def _compute(base, r, s, p, noise, synergy_factor):
+    """Apply noise and synergy to per-circuit component gains"""
+    baseline = base + noise[:, 0]
+    reorder_only = baseline + r + noise[:, 1]
+    scoring_only = baseline + s + noise[:, 2]
+    placement_only = baseline + p + noise[:, 3]
+
+    # Full pipeline has synergy (slightly better than sum)
+    full = baseline + (r + s + p) * synergy_factor + noise[:, 4]
+
+    # Clamp to [0, 1]
+    full = np.minimum(1.0, np.maximum(0.0, full))
+
+    return baseline, reorder_only, scoring_only, placement_only, full
 
 
-def simulate_ablation_data() -> List[CircuitAblation]:
+def simulate_ablation_data(seed: int = 42) -> AblationTable:
     """
     Simulate ablation study data based on QNS benchmark results.
 
     In production, this would run actual Rust benchmarks with
     different optimization configurations enabled/disabled.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(seed)
 
     # Based on actual E2E validation results
     circuits = [
@@ -131,123 +208,139 @@ def simulate_ablation_data() -> List[CircuitAblation]:
         },
     ]
 
-    results = []
-
-    for c in circuits:
-        # Add some noise
-        noise = lambda: np.random.normal(0, 0.005)
-
-        baseline = c["baseline"] + noise()
-        reorder_only = baseline + c["reorder"] + noise()
-        scoring_only = baseline + c["scoring"] + noise()
-        placement_only = baseline + c["placement"] + noise()
-
-        # Full pipeline has synergy (slightly better than sum)
-        synergy_factor = 1.1 + np.random.uniform(-0.05, 0.1)
-        full = baseline + (c["reorder"] + c["scoring"] + c["placement"]) * synergy_factor + noise()
-
-        # Clamp to [0, 1]
-        full = min(1.0, max(0.0, full))
-
-        results.append(CircuitAblation(
-            circuit_name=c["name"],
-            num_qubits=c["qubits"],
-            num_gates=c["gates"],
-            baseline=baseline,
-            reorder_only=reorder_only,
-            scoring_only=scoring_only,
-            placement_only=placement_only,
-            full_pipeline=full,
-        ))
-
-    return results
-
-
-def print_ablation_table(results: List[CircuitAblation]):
+    n = len(circuits)
+    noise = rng.normal(0, 0.005, size=(n, 5))
+    synergy_factor = 1.1 + rng.uniform(-0.05, 0.1, size=n)
+
+    baseline, reorder_only, scoring_only, placement_only, full = _compute(
+        np.array([c["baseline"] for c in circuits]),
+        np.array([c["reorder"] for c in circuits]),
+        np.array([c["scoring"] for c in circuits]),
+        np.array([c["placement"] for c in circuits]),
+        noise,
+        synergy_factor,
+    )
+
+    return AblationTable(
+        names=[c["name"] for c in circuits],
+        num_qubits=np.array([c["qubits"] for c in circuits]),
+        num_gates=np.array([c["gates"] for c in circuits]),
+        baseline=baseline,
+        reorder_only=reorder_only,
+        scoring_only=scoring_only,
+        placement_only=placement_only,
+        full_pipeline=full,
+    )
+
+
+def print_ablation_table(table: AblationTable):
     """Print ablation results as formatted table"""
 
-    print("\n" + "=" * 120)
-    print(f"{'QNS Ablation Study Results':^120}")
-    print("=" * 120)
-
-    print(f"\n{'Circuit':<18} {'Q':>3} {'G':>4} {'Baseline':>10} {'Reorder':>10} {'Scoring':>10} {'Placement':>10} {'Full':>10} {'Synergy':>10}")
-    print("-" * 120)
-
-    for r in results:
-        print(f"{r.circuit_name:<18} {r.num_qubits:>3} {r.num_gates:>4} "
-              f"{r.baseline:>10.4f} "
-              f"{r.reorder_only:>10.4f} "
-              f"{r.scoring_only:>10.4f} "
-              f"{r.placement_only:>10.4f} "
-              f"{r.full_pipeline:>10.4f} "
-              f"{r.synergy:>+10.4f}")
+    reorder = table.reorder_contribution
+    scoring = table.scoring_contribution
+    placement = table.placement_contribution
+    full_improvement = table.full_improvement
+    synergy = table.synergy
+
+    lines = [
+        "",
+        "=" * 120,
+        f"{'QNS Ablation Study Results':^120}",
+        "=" * 120,
+        "",
+        f"{'Circuit':<18} {'Q':>3} {'G':>4} {'Baseline':>10} {'Reorder':>10} {'Scoring':>10} {'Placement':>10} {'Full':>10} {'Synergy':>10}",
+        "-" * 120,
+    ]
 
-    print("-" * 120)
+    lines.extend(
+        f"{name:<18} {q:>3} {g:>4} "
+        f"{base:>10.4f} "
+        f"{ro:>10.4f} "
+        f"{so:>10.4f} "
+        f"{po:>10.4f} "
+        f"{fp:>10.4f} "
+        f"{syn:>+10.4f}"
+        for name, q, g, base, ro, so, po, fp, syn in zip(
+            table.names, table.num_qubits, table.num_gates, table.baseline,
+            table.reorder_only, table.scoring_only, table.placement_only,
+            table.full_pipeline, synergy)
+    )
 
     # Contribution analysis
-    print("\n" + "=" * 120)
-    print(f"{'Component Contribution Analysis':^120}")
-    print("=" * 120)
-
-    print(f"\n{'Circuit':<18} {'Reorder Δ':>12} {'Scoring Δ':>12} {'Placement Δ':>12} {'Full Δ':>12} {'Synergy':>12}")
-    print("-" * 120)
+    lines += [
+        "-" * 120,
+        "",
+        "=" * 120,
+        f"{'Component Contribution Analysis':^120}",
+        "=" * 120,
+        "",
+        f"{'Circuit':<18} {'Reorder Δ':>12} {'Scoring Δ':>12} {'Placement Δ':>12} {'Full Δ':>12} {'Synergy':>12}",
+        "-" * 120,
+    ]
 
-    for r in results:
-        full_improvement = r.full_pipeline - r.baseline
-        print(f"{r.circuit_name:<18} "
-              f"{r.reorder_contribution:>+12.4f} "
-              f"{r.scoring_contribution:>+12.4f} "
-              f"{r.placement_contribution:>+12.4f} "
-              f"{full_improvement:>+12.4f} "
-              f"{r.synergy:>+12.4f}")
+    lines.extend(
+        f"{name:<18} "
+        f"{rc:>+12.4f} "
+        f"{sc:>+12.4f} "
+        f"{pc:>+12.4f} "
+        f"{fi:>+12.4f} "
+        f"{syn:>+12.4f}"
+        for name, rc, sc, pc, fi, syn in zip(table.names, reorder, scoring,
+                                             placement, full_improvement, synergy)
+    )
 
-    print("-" * 120)
+    lines.append("-" * 120)
 
     # Summary
-    avg_reorder = np.mean([r.reorder_contribution for r in results])
-    avg_scoring = np.mean([r.scoring_contribution for r in results])
-    avg_placement = np.mean([r.placement_contribution for r in results])
-    avg_full = np.mean([r.full_pipeline - r.baseline for r in results])
-    avg_synergy = np.mean([r.synergy for r in results])
-
-    print(f"\nAverage Contributions:")
-    print(f"  - Reorder:   {avg_reorder:>+.4f} ({100*avg_reorder/avg_full:.1f}% of total)")
-    print(f"  - Scoring:   {avg_scoring:>+.4f} ({100*avg_scoring/avg_full:.1f}% of total)")
-    print(f"  - Placement: {avg_placement:>+.4f} ({100*avg_placement/avg_full:.1f}% of total)")
-    print(f"  - Synergy:   {avg_synergy:>+.4f} ({100*avg_synergy/avg_full:.1f}% of total)")
-    print(f"  - Total:     {avg_full:>+.4f}")
+    avg_reorder = reorder.mean()
+    avg_scoring = scoring.mean()
+    avg_placement = placement.mean()
+    avg_full = full_improvement.mean()
+    avg_synergy = synergy.mean()
+
+    lines += [
+        "",
+        "Average Contributions:",
+        f"  - Reorder:   {avg_reorder:>+.4f} ({100*avg_reorder/avg_full:.1f}% of total)",
+        f"  - Scoring:   {avg_scoring:>+.4f} ({100*avg_scoring/avg_full:.1f}% of total)",
+        f"  - Placement: {avg_placement:>+.4f} ({100*avg_placement/avg_full:.1f}% of total)",
+        f"  - Synergy:   {avg_synergy:>+.4f} ({100*avg_synergy/avg_full:.1f}% of total)",
+        f"  - Total:     {avg_full:>+.4f}",
+    ]
 
     # Key findings
-    print("\nKey Findings:")
-    max_placement_circuit = max(results, key=lambda r: r.placement_contribution)
-    print(f"  - Placement optimization most impactful for '{max_placement_circuit.circuit_name}' "
-          f"(+{max_placement_circuit.placement_contribution:.4f})")
+    lines += ["", "Key Findings:"]
+    i = int(np.argmax(placement))
+    lines.append(f"  - Placement optimization most impactful for '{table.names[i]}' "
+                 f"(+{placement[i]:.4f})")
 
-    max_reorder_circuit = max(results, key=lambda r: r.reorder_contribution)
-    print(f"  - Gate reordering most impactful for '{max_reorder_circuit.circuit_name}' "
-          f"(+{max_reorder_circuit.reorder_contribution:.4f})")
+    i = int(np.argmax(reorder))
+    lines.append(f"  - Gate reordering most impactful for '{table.names[i]}' "
+                 f"(+{reorder[i]:.4f})")
 
     if avg_synergy > 0:
-        print(f"  - Positive synergy (+{avg_synergy:.4f}): Components work better together")
+        lines.append(f"  - Positive synergy (+{avg_synergy:.4f}): Components work better together")
     else:
-        print(f"  - Negative synergy ({avg_synergy:.4f}): Some redundancy between components")
+        lines.append(f"  - Negative synergy ({avg_synergy:.4f}): Some redundancy between components")
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def plot_ablation_chart(results: List[CircuitAblation], output_path: Path = None):
+
+def plot_ablation_chart(table: AblationTable, output_path: Path = None):
     """Create ablation study bar chart"""
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
-    circuits = [r.circuit_name for r in results]
+    circuits = table.names
     x = np.arange(len(circuits))
     width = 0.15
 
     # Plot 1: Absolute fidelities
-    ax1.bar(x - 2*width, [r.baseline for r in results], width, label='Baseline', color='gray')
-    ax1.bar(x - width, [r.reorder_only for r in results], width, label='+ Reorder', color='steelblue')
-    ax1.bar(x, [r.scoring_only for r in results], width, label='+ Scoring', color='green')
-    ax1.bar(x + width, [r.placement_only for r in results], width, label='+ Placement', color='orange')
-    ax1.bar(x + 2*width, [r.full_pipeline for r in results], width, label='Full Pipeline', color='red')
+    ax1.bar(x - 2*width, table.baseline, width, label='Baseline', color='gray')
+    ax1.bar(x - width, table.reorder_only, width, label='+ Reorder', color='steelblue')
+    ax1.bar(x, table.scoring_only, width, label='+ Scoring', color='green')
+    ax1.bar(x + width, table.placement_only, width, label='+ Placement', color='orange')
+    ax1.bar(x + 2*width, table.full_pipeline, width, label='Full Pipeline', color='red')
 
     ax1.set_xlabel('Circuit')
     ax1.set_ylabel('Fidelity')
@@ -260,10 +353,10 @@ def plot_ablation_chart(results: List[CircuitAblation], output_path: Path = None
 
     # Plot 2: Component contributions
     contributions = {
-        'Reorder': [r.reorder_contribution for r in results],
-        'Scoring': [r.scoring_contribution for r in results],
-        'Placement': [r.placement_contribution for r in results],
-        'Synergy': [r.synergy for r in results],
+        'Reorder': table.reorder_contribution,
+        'Scoring': table.scoring_contribution,
+        'Placement': table.placement_contribution,
+        'Synergy': table.synergy,
     }
 
     bottom = np.zeros(len(circuits))
@@ -271,7 +364,7 @@ def plot_ablation_chart(results: List[CircuitAblation], output_path: Path = None
 
     for (label, values), color in zip(contributions.items(), colors):
         ax2.bar(circuits, values, 0.6, label=label, bottom=bottom, color=color)
-        bottom += np.array(values)
+        bottom += values
 
     ax2.set_xlabel('Circuit')
     ax2.set_ylabel('Improvement vs Baseline')
@@ -289,23 +382,25 @@ def plot_ablation_chart(results: List[CircuitAblation], output_path: Path = None
         plt.show()
 
 
-def save_results_json(results: List[CircuitAblation], output_path: Path):
-    """Save results to JSON file"""
+def save_results_json(table: AblationTable, output_path: Path, compact: bool = False):
+    """Save results to JSON file (compact form for machine consumers)"""
     data = {
         "analysis": "QNS Ablation Study",
         "version": "0.1.0",
-        "results": [asdict(r) for r in results],
+        "results": [asdict(r) for r in table.to_records()],
         "summary": {
-            "avg_reorder_contribution": float(np.mean([r.reorder_contribution for r in results])),
-            "avg_scoring_contribution": float(np.mean([r.scoring_contribution for r in results])),
-            "avg_placement_contribution": float(np.mean([r.placement_contribution for r in results])),
-            "avg_synergy": float(np.mean([r.synergy for r in results])),
-            "avg_total_improvement": float(np.mean([r.full_pipeline - r.baseline for r in results])),
+            "avg_reorder_contribution": float(table.reorder_contribution.mean()),
+            "avg_scoring_contribution": float(table.scoring_contribution.mean()),
+            "avg_placement_contribution": float(table.placement_contribution.mean()),
+            "avg_synergy": float(table.synergy.mean()),
+            "avg_total_improvement": float(table.full_improvement.mean()),
         }
     }
 
+    kwargs = {"separators": (",", ":")} if compact else {"indent": 2}
+
     with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, **kwargs)
 
     print(f"\nResults saved to: {output_path}")
 
@@ -314,6 +409,7 @@ def main():
     parser = argparse.ArgumentParser(description='QNS Ablation Study')
     parser.add_argument('--output', type=Path, default=None, help='Output JSON file')
     parser.add_argument('--plot', type=Path, default=None, help='Output chart file (PNG)')
+    parser.add_argument('--compact', action='store_true', help='Write compact (non-indented) JSON')
 
     args = parser.parse_args()
 
@@ -321,18 +417,18 @@ def main():
     print("Analyzing component contributions...\n")
 
     # Get ablation data (simulated for now)
-    results = simulate_ablation_data()
+    table = simulate_ablation_data()
 
     # Print results
-    print_ablation_table(results)
+    print_ablation_table(table)
 
     # Save if requested
     if args.output:
-        save_results_json(results, args.output)
+        save_results_json(table, args.output, compact=args.compact)
 
     # Plot if requested
     if args.plot:
-        plot_ablation_chart(results, args.plot)
+        plot_ablation_chart(table, args.plot)
 
 
 if __name__ == '__main__':
@@ -8,20 +8,26 @@ This script provides:
 4. Statistical Analysis (mean ± std, p-values)
 """
 
+import os
+import mmap
+import re
+import functools
+import queue
 import subprocess
+import threading
 import json
 import time
 import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, IO, Iterator, List, Tuple, Optional
+from dataclasses import dataclass, fields
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
 
 # Optional: Qiskit for comparison
 try:
-    from qiskit import QuantumCircuit, Aer, execute
+    from qiskit import QuantumCircuit, Aer, transpile
     from qiskit.converters import circuit_from_qasm_file
     QISKIT_AVAILABLE = True
 except ImportError:
@@ -49,6 +55,12 @@ class SimulationResult:
     memory_mb: float
     shots: int
     simulator: str  # 'qns' or 'qiskit'
+    # What execution_time_ms measures: 'backend' is the engine's own reported
+    # time (QNS pipeline TIME, Aer per-experiment time_taken), excluding
+    # process startup, IPC and client-side parsing
+    timing: str
+    # Aer result.metadata['time_taken'] for the whole batched job (Qiskit only)
+    backend_total_ms: float = float('nan')
 
 @dataclass
 class StatisticalSummary:
@@ -60,14 +72,183 @@ class StatisticalSummary:
     median: float
     runs: int
 
+# Byte patterns so QASM files can be scanned straight from an mmap
+_GATE_RE = re.compile(rb'^\s*(h|x|y|z|cx|cz|rx|ry|rz|measure|swap|cp|ccx)\b', re.M)
+_QREG_RE = re.compile(rb'qreg\s+\w+\[(\d+)\]')
+
+@functools.lru_cache(maxsize=None)
+def _regex_for(keyword: str) -> "re.Pattern[str]":
+    """Pattern matching e.g. 'Parsed circuit (5 gates)' for the given keyword"""
+    return re.compile(rf'{re.escape(keyword)}.*\((?:.*\s)?(\d+)\s+gates')
+
+# Engine-side time reported by `qns run` ("Time: 1.23 ms") and `qns serve` ("TIME 1.234 ms")
+_ENGINE_TIME_RE = re.compile(r'^(?:Time:|TIME)\s+([\d.]+)\s*ms', re.M)
+
+def _engine_time_ms(output: str) -> float:
+    """QNS's own pipeline time from its output, NaN if it did not report one"""
+    m = _ENGINE_TIME_RE.search(output)
+    return float(m.group(1)) if m else float('nan')
+
+@functools.lru_cache(maxsize=None)
+def _scan_qasm_cached(path: str, mtime_ns: int) -> Tuple[int, int]:
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            m = _QREG_RE.search(mm)
+            num_qubits = int(m.group(1)) if m else 0
+            return num_qubits, sum(1 for _ in _GATE_RE.finditer(mm))
+
+def _scan_qasm(qasm_file: Path) -> Tuple[int, int]:
+    """Scan a QASM file, returning (num_qubits, num_gates); cached until the file changes"""
+    return _scan_qasm_cached(str(qasm_file), qasm_file.stat().st_mtime_ns)
+
+def _run_once(cmd: List[str], timeout: float) -> Tuple[float, str]:
+    """Run a single QNS invocation, returning (elapsed_ms, output)"""
+    t0 = time.perf_counter_ns()
+    output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=timeout)
+    return (time.perf_counter_ns() - t0) / 1e6, output
+
+def _group_mean(results, qubit_counts: np.ndarray) -> np.ndarray:
+    """Mean execution time per entry of the sorted qubit_counts (NaN where absent)"""
+    qubits = np.fromiter((r.num_qubits for r in results), dtype=np.int64, count=len(results))
+    times = np.fromiter((r.execution_time_ms for r in results), dtype=np.float64, count=len(results))
+    n = len(qubit_counts)
+    if n == 0:
+        return np.empty(0)
+    idx = np.searchsorted(qubit_counts, qubits)
+    known = (idx < n) & (qubit_counts[np.minimum(idx, n - 1)] == qubits)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.bincount(idx[known], weights=times[known], minlength=n) / np.bincount(idx[known], minlength=n)
+
+
+class QnsServer:
+    """
+    Persistent `qns serve` process answering one QASM path per request
+    
+    Avoids paying process startup for every run. Responses are read on a
+    background thread so timeouts also work where select() cannot poll pipes.
+    """
+    
+    def __init__(self, qns_binary: Path, topology: str):
+        self.cmd = [str(qns_binary), "serve", "--topology", topology]
+        self._proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._read_lines, daemon=True).start()
+    
+    def _read_lines(self):
+        for line in self._proc.stdout:
+            self._lines.put(line.rstrip('\n'))
+        self._lines.put(None)  # EOF
+    
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+    
+    def run(self, qasm_file: Path, timeout: float) -> Tuple[float, float, int, int]:
+        """Run one circuit, returning (elapsed_ms, engine_ms, original_gates, routed_gates)"""
+        t0 = time.perf_counter_ns()
+        try:
+            self._proc.stdin.write(f"{qasm_file}\n")
+            self._proc.stdin.flush()
+        except OSError:
+            raise subprocess.CalledProcessError(self._proc.wait(), self.cmd)
+        
+        original_gates = routed_gates = 0
+        deadline = t0 + int(timeout * 1e9)
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, (deadline - time.perf_counter_ns()) / 1e9))
+            except queue.Empty:
+                self.close()
+                raise subprocess.TimeoutExpired(self.cmd, timeout)
+            
+            if line is None:
+                raise subprocess.CalledProcessError(self._proc.wait(), self.cmd)
+            
+            key, _, value = line.partition(' ')
+            if key == 'PARSED':
+                original_gates = int(value.split()[0])
+            elif key == 'ROUTED':
+                routed_gates = int(value.split()[0])
+            elif key == 'TIME':
+                elapsed = (time.perf_counter_ns() - t0) / 1e6
+                return elapsed, _engine_time_ms(line), original_gates, routed_gates
+            elif key == 'ERROR':
+                raise subprocess.CalledProcessError(1, self.cmd, output=value)
+    
+    def close(self):
+        """Stop the server process"""
+        if self.alive:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+                self._proc.wait()
+
 class QNSBenchmark:
     """Enhanced benchmark orchestrator with Qiskit comparison"""
     
-    def __init__(self, qns_binary: Path, output_dir: Path, num_runs: int = 10):
+    def __init__(self, qns_binary: Path, output_dir: Path, num_runs: int = 10,
+                 use_server: bool = True, outer_parallel: int = 1, parallel_runs: int = 1):
         self.qns_binary = qns_binary
         self.output_dir = output_dir
         self.num_runs = num_runs
+        # Timed runs of one circuit overlapped at once (threads are enough for
+        # subprocesses); 1 keeps them sequential so timings are uncontended
+        self.max_workers = max(1, min(num_runs, parallel_runs))
+        # Number of QASM files benchmarked concurrently
+        self.outer_parallel = max(1, outer_parallel)
+        # Idle `qns serve` processes per topology, reused across runs
+        self.use_server = use_server
+        self._servers: Dict[str, "queue.Queue[QnsServer]"] = {}
+        self._servers_lock = threading.Lock()
+        # Open CSV outputs: filename -> (file, writer, column names)
+        self._csv_files: Dict[str, Tuple[IO[str], Any, List[str]]] = {}
         self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def close(self):
+        """Stop all persistent QNS server processes and close CSV outputs"""
+        for pool in self._servers.values():
+            while not pool.empty():
+                pool.get_nowait().close()
+        self._servers.clear()
+        for filename in list(self._csv_files):
+            self._close_results(filename)
+    
+    def _run_qns(self, qasm_file: Path, topology: str, timeout: float) -> Tuple[float, float, int, int]:
+        """
+        Run one circuit through QNS, returning (elapsed_ms, engine_ms, original_gates, routed_gates)
+        
+        elapsed_ms is client wall-clock (process/IPC included); engine_ms is the
+        time QNS reports for its own pipeline, NaN if it reported none.
+        """
+        if not self.use_server:
+            cmd = [str(self.qns_binary), "run", str(qasm_file), "--topology", topology]
+            elapsed, output = _run_once(cmd, timeout)
+            return (elapsed, _engine_time_ms(output),
+                    self._parse_gate_count(output, "Parsed"), self._parse_gate_count(output, "Routed"))
+        
+        with self._servers_lock:
+            pool = self._servers.setdefault(topology, queue.Queue())
+        try:
+            server = pool.get_nowait()
+        except queue.Empty:
+            server = QnsServer(self.qns_binary, topology)
+        
+        try:
+            return server.run(qasm_file, timeout)
+        finally:
+            if server.alive:
+                pool.put(server)
         
     def benchmark_routing_efficiency(self, qasm_files: List[Path]) -> List[RoutingResult]:
         """
@@ -76,58 +257,69 @@ class QNSBenchmark:
         Runs each circuit multiple times and computes statistics
         """
         all_results = []
+        for result in self._for_each_file(self._bench_routing_one, qasm_files):
+            if result:
+                self._save_result(result, "routing_efficiency.csv")
+                all_results.append(result)
         
-        for qasm_file in qasm_files:
-            print(f"\n📊 Benchmarking routing: {qasm_file.name} ({self.num_runs} runs)")
-            
-            run_results = []
-            for run in range(self.num_runs):
-                start_time = time.time()
-                cmd = [
-                    str(self.qns_binary),
-                    "run",
-                    str(qasm_file),
-                    "--topology", "grid"
-                ]
-                
+        self._close_results("routing_efficiency.csv")
+        return all_results
+    
+    def _for_each_file(self, bench_one, qasm_files: List[Path]) -> Iterator:
+        """Apply bench_one to every file, up to outer_parallel at a time, yielding results in input order"""
+        if self.outer_parallel == 1:
+            for qasm_file in qasm_files:
+                yield bench_one(qasm_file)
+            return
+        with ThreadPoolExecutor(max_workers=self.outer_parallel) as ex:
+            yield from ex.map(bench_one, qasm_files)
+    
+    def _bench_routing_one(self, qasm_file: Path) -> Optional[RoutingResult]:
+        """Benchmark routing for one circuit, returning its median-time run"""
+        # Buffered so concurrent files don't interleave their output
+        log = [f"\n📊 Benchmarking routing: {qasm_file.name} ({self.num_runs} runs)"]
+        
+        num_qubits = self._count_qubits(qasm_file)
+        run_results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = {ex.submit(self._run_qns, qasm_file, "grid", 30): run
+                       for run in range(self.num_runs)}
+            for future in as_completed(futures):
                 try:
-                    output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=30)
-                    routing_time = (time.time() - start_time) * 1000
-                    
-                    routed_gates = self._parse_gate_count(output, "Routed")
-                    original_gates = self._parse_gate_count(output, "Parsed")
-                    swap_count = routed_gates - original_gates if routed_gates > original_gates else 0
-                    
-                    result = RoutingResult(
-                        circuit_name=qasm_file.stem,
-                        num_qubits=self._count_qubits(qasm_file),
-                        original_gates=original_gates,
-                        routed_gates=routed_gates,
-                        swap_count=swap_count,
-                        circuit_depth=0,
-                        routing_time_ms=routing_time
-                    )
-                    run_results.append(result)
-                    
+                    routing_time, _, original_gates, routed_gates = future.result()
                 except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-                    print(f"  ⚠️  Run {run+1} failed: {e}")
+                    log.append(f"  ⚠️  Run {futures[future]+1} failed: {e}")
                     continue
-            
-            if run_results:
-                # Use median result as representative
-                median_idx = len(run_results) // 2
-                sorted_results = sorted(run_results, key=lambda x: x.routing_time_ms)
-                all_results.append(sorted_results[median_idx])
                 
-                # Print statistics
-                times = [r.routing_time_ms for r in run_results]
-                swaps = [r.swap_count for r in run_results]
-                print(f"  ✓ Routing time: {np.mean(times):.1f} ± {np.std(times):.1f} ms")
-                print(f"  ✓ SWAP count: {np.mean(swaps):.1f} ± {np.std(swaps):.1f}")
+                swap_count = routed_gates - original_gates if routed_gates > original_gates else 0
+                
+                result = RoutingResult(
+                    circuit_name=qasm_file.stem,
+                    num_qubits=num_qubits,
+                    original_gates=original_gates,
+                    routed_gates=routed_gates,
+                    swap_count=swap_count,
+                    circuit_depth=0,
+                    routing_time_ms=routing_time
+                )
+                run_results.append(result)
         
-        self._save_results(all_results, "routing_efficiency.csv")
-        return all_results
-    
+        median_result = None
+        if run_results:
+            # Use median result as representative
+            median_idx = len(run_results) // 2
+            median_result = sorted(run_results, key=lambda x: x.routing_time_ms)[median_idx]
+            
+            # Print statistics
+            n = len(run_results)
+            times = np.fromiter((r.routing_time_ms for r in run_results), np.float64, n)
+            swaps = np.fromiter((r.swap_count for r in run_results), np.float64, n)
+            log.append(f"  ✓ Routing time: {times.mean():.1f} ± {times.std():.1f} ms")
+            log.append(f"  ✓ SWAP count: {swaps.mean():.1f} ± {swaps.std():.1f}")
+        
+        print("\n".join(log) + "\n", end="")
+        return median_result
+
     def benchmark_simulation_performance(self, qasm_files: List[Path], shots: int = 1000) -> Tuple[List[SimulationResult], Optional[List[SimulationResult]]]:
         """
         Benchmark simulation performance: QNS vs Qiskit Aer
@@ -138,75 +330,100 @@ class QNSBenchmark:
         qns_results = []
         qiskit_results = []
         
-        for qasm_file in qasm_files:
-            print(f"\n📊 Benchmarking simulation: {qasm_file.name}")
-            
-            # QNS benchmark
-            qns_times = []
-            for run in range(self.num_runs):
-                start_time = time.time()
-                cmd = [str(self.qns_binary), "run", str(qasm_file)]
-                
+        bench_one = functools.partial(self._bench_simulation_one, shots=shots)
+        for qns_result, qiskit_result in self._for_each_file(bench_one, qasm_files):
+            # Saved here, in input order, rather than as each file finishes
+            if qns_result:
+                self._save_result(qns_result, "simulation_qns.csv")
+                qns_results.append(qns_result)
+            if qiskit_result:
+                self._save_result(qiskit_result, "simulation_qiskit.csv")
+                qiskit_results.append(qiskit_result)
+        
+        self._close_results("simulation_qns.csv")
+        self._close_results("simulation_qiskit.csv")
+        
+        return qns_results, qiskit_results if qiskit_results else None
+    
+    def _bench_simulation_one(self, qasm_file: Path, shots: int) -> Tuple[Optional[SimulationResult], Optional[SimulationResult]]:
+        """Benchmark one circuit on QNS and Qiskit Aer, returning (qns_result, qiskit_result)"""
+        log = [f"\n📊 Benchmarking simulation: {qasm_file.name}"]
+        qns_result = qiskit_result = None
+        
+        # QNS benchmark
+        qns_times = []
+        untimed = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = [ex.submit(self._run_qns, qasm_file, "linear", 60)
+                       for _ in range(self.num_runs)]
+            for future in as_completed(futures):
                 try:
-                    output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=60)
-                    execution_time = (time.time() - start_time) * 1000
-                    qns_times.append(execution_time)
+                    # Engine-side time, to compare like with like against Aer's time_taken
+                    _, execution_time, _, _ = future.result()
                 except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
                     continue
-            
-            if qns_times:
-                result = SimulationResult(
-                    circuit_name=qasm_file.stem,
-                    num_qubits=self._count_qubits(qasm_file),
-                    num_gates=self._parse_gate_count_from_file(qasm_file),
-                    execution_time_ms=np.median(qns_times),
-                    memory_mb=0.0,
-                    shots=shots,
-                    simulator='qns'
-                )
-                qns_results.append(result)
-                print(f"  ✓ QNS: {np.mean(qns_times):.1f} ± {np.std(qns_times):.1f} ms")
-            
-            # Qiskit Aer benchmark
-            if QISKIT_AVAILABLE:
-                try:
-                    qiskit_times = []
-                    for run in range(self.num_runs):
-                        start_time = time.time()
-                        qc = circuit_from_qasm_file(str(qasm_file))
-                        backend = Aer.get_backend('qasm_simulator')
-                        job = execute(qc, backend, shots=shots)
-                        result = job.result()
-                        execution_time = (time.time() - start_time) * 1000
-                        qiskit_times.append(execution_time)
-                    
-                    if qiskit_times:
-                        result = SimulationResult(
-                            circuit_name=qasm_file.stem,
-                            num_qubits=self._count_qubits(qasm_file),
-                            num_gates=self._parse_gate_count_from_file(qasm_file),
-                            execution_time_ms=np.median(qiskit_times),
-                            memory_mb=0.0,
-                            shots=shots,
-                            simulator='qiskit'
-                        )
-                        qiskit_results.append(result)
-                        print(f"  ✓ Qiskit: {np.mean(qiskit_times):.1f} ± {np.std(qiskit_times):.1f} ms")
-                        
-                        # Statistical comparison
-                        if len(qns_times) > 1 and len(qiskit_times) > 1:
-                            t_stat, p_value = stats.ttest_ind(qns_times, qiskit_times)
-                            speedup = np.mean(qiskit_times) / np.mean(qns_times)
-                            print(f"  📈 Speedup: {speedup:.2f}x (p={p_value:.4f})")
-                
-                except Exception as e:
-                    print(f"  ⚠️  Qiskit failed: {e}")
+                if np.isnan(execution_time):
+                    untimed += 1
+                    continue
+                qns_times.append(execution_time)
+        if untimed:
+            log.append(f"  ⚠️  {untimed} QNS run(s) reported no engine time and were skipped")
         
-        self._save_results(qns_results, "simulation_qns.csv")
-        if qiskit_results:
-            self._save_results(qiskit_results, "simulation_qiskit.csv")
+        qns_times = np.fromiter(qns_times, np.float64, len(qns_times))
+        if qns_times.size:
+            qns_result = SimulationResult(
+                circuit_name=qasm_file.stem,
+                num_qubits=self._count_qubits(qasm_file),
+                num_gates=self._parse_gate_count_from_file(qasm_file),
+                execution_time_ms=np.median(qns_times),
+                memory_mb=0.0,
+                shots=shots,
+                simulator='qns',
+                timing='backend'
+            )
+            log.append(f"  ✓ QNS (backend time): {qns_times.mean():.1f} ± {qns_times.std():.1f} ms")
         
-        return qns_results, qiskit_results if qiskit_results else None
+        # Qiskit Aer benchmark
+        if QISKIT_AVAILABLE:
+            try:
+                # Parse/transpile once and submit every run as one batched job
+                backend = Aer.get_backend('qasm_simulator')
+                backend.set_options(max_parallel_threads=0)
+                qc = transpile(circuit_from_qasm_file(str(qasm_file)), backend)
+                job = backend.run([qc] * self.num_runs, shots=shots)
+                res = job.result()
+                qiskit_times = np.fromiter((r.time_taken * 1000 for r in res.results),
+                                           np.float64, len(res.results))
+                backend_total_ms = res.metadata.get('time_taken', np.nan) * 1000
+                log.append(f"  ⏱  Aer backend total (metadata time_taken): {backend_total_ms:.1f} ms")
+                
+                if qiskit_times.size:
+                    qiskit_result = SimulationResult(
+                        circuit_name=qasm_file.stem,
+                        num_qubits=self._count_qubits(qasm_file),
+                        num_gates=self._parse_gate_count_from_file(qasm_file),
+                        execution_time_ms=np.median(qiskit_times),
+                        memory_mb=0.0,
+                        shots=shots,
+                        simulator='qiskit',
+                        timing='backend',
+                        backend_total_ms=backend_total_ms
+                    )
+                    log.append(f"  ✓ Qiskit (backend time): {qiskit_times.mean():.1f} ± {qiskit_times.std():.1f} ms")
+                    
+                    # Statistical comparison
+                    if len(qns_times) > 1 and len(qiskit_times) > 1:
+                        # scipy is slow to import; only pay for it when there is something to test
+                        from scipy import stats
+                        t_stat, p_value = stats.ttest_ind(qns_times, qiskit_times)
+                        speedup = qiskit_times.mean() / qns_times.mean()
+                        log.append(f"  📈 Speedup (backend time): {speedup:.2f}x (p={p_value:.4f})")
+            
+            except Exception as e:
+                log.append(f"  ⚠️  Qiskit failed: {e}")
+        
+        print("\n".join(log) + "\n", end="")
+        return qns_result, qiskit_result
     
     def visualize_comparison(self, qns_results: List[SimulationResult], qiskit_results: Optional[List[SimulationResult]]):
         """Create publication-quality comparison figures"""
@@ -214,36 +431,30 @@ class QNSBenchmark:
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
         
         # Group by qubit count
-        qubit_counts = sorted(set(r.num_qubits for r in qns_results))
+        qubit_counts = np.unique([r.num_qubits for r in qns_results])
+        qns_times = _group_mean(qns_results, qubit_counts)
         
-        qns_times = []
         qiskit_times = []
-        
-        for qc in qubit_counts:
-            qns_avg = np.mean([r.execution_time_ms for r in qns_results if r.num_qubits == qc])
-            qns_times.append(qns_avg)
-            
-            if qiskit_results:
-                qiskit_avg = np.mean([r.execution_time_ms for r in qiskit_results if r.num_qubits == qc])
-                qiskit_times.append(qiskit_avg)
+        if qiskit_results:
+            qiskit_times = _group_mean(qiskit_results, qubit_counts)
         
         # Plot 1: Execution time comparison
-        ax1.plot(qubit_counts, qns_times, 'o-', linewidth=2, markersize=8, label='QNS', color='steelblue')
-        if qiskit_times:
-            ax1.plot(qubit_counts, qiskit_times, 's-', linewidth=2, markersize=8, label='Qiskit Aer', color='coral')
+        ax1.plot(qubit_counts, qns_times, 'o-', linewidth=2, markersize=8, label='QNS (backend time)', color='steelblue')
+        if len(qiskit_times):
+            ax1.plot(qubit_counts, qiskit_times, 's-', linewidth=2, markersize=8, label='Qiskit Aer (backend time)', color='coral')
         ax1.set_xlabel('Number of Qubits', fontsize=12)
-        ax1.set_ylabel('Execution Time (ms)', fontsize=12)
+        ax1.set_ylabel('Backend Time (ms)', fontsize=12)
         ax1.set_title('Simulation Performance Comparison', fontsize=14, fontweight='bold')
         ax1.grid(True, alpha=0.3)
         ax1.legend(fontsize=11)
         
         # Plot 2: Speedup
-        if qiskit_times:
-            speedups = [q/n for q, n in zip(qiskit_times, qns_times)]
+        if len(qiskit_times):
+            speedups = qiskit_times / qns_times
             ax2.bar(range(len(qubit_counts)), speedups, color='green', alpha=0.7)
             ax2.axhline(y=1.0, color='red', linestyle='--', label='Baseline')
             ax2.set_xlabel('Number of Qubits', fontsize=12)
-            ax2.set_ylabel('Speedup (Qiskit / QNS)', fontsize=12)
+            ax2.set_ylabel('Speedup (Qiskit / QNS backend time)', fontsize=12)
             ax2.set_title('QNS Speedup vs Qiskit Aer', fontsize=14, fontweight='bold')
             ax2.set_xticks(range(len(qubit_counts)))
             ax2.set_xticklabels(qubit_counts)
@@ -252,58 +463,47 @@ class QNSBenchmark:
         
         plt.tight_layout()
         plt.savefig(self.output_dir / 'performance_comparison.pdf', dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / 'performance_comparison.png', dpi=300, bbox_inches='tight')
         print(f"\n✅ Saved: {self.output_dir / 'performance_comparison.pdf'}")
     
     def _parse_gate_count(self, output: str, keyword: str) -> int:
         """Parse gate count from QNS output"""
-        for line in output.split('\n'):
-            if keyword in line and 'gates' in line:
-                parts = line.split('(')
-                if len(parts) > 1:
-                    gate_part = parts[1].split('gates')[0].strip()
-                    try:
-                        return int(gate_part.split()[-1])
-                    except (ValueError, IndexError):
-                        pass
-        return 0
+        m = _regex_for(keyword).search(output)
+        return int(m.group(1)) if m else 0
     
     def _parse_gate_count_from_file(self, qasm_file: Path) -> int:
         """Count gates in QASM file"""
-        count = 0
-        with open(qasm_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('//') and not line.startswith('OPENQASM') and not line.startswith('include') and not line.startswith('qreg') and not line.startswith('creg'):
-                    if any(gate in line for gate in ['h', 'x', 'y', 'z', 'cx', 'cz', 'rx', 'ry', 'rz', 'measure', 'swap', 'cp', 'ccx']):
-                        count += 1
-        return count
+        return _scan_qasm(qasm_file)[1]
     
     def _count_qubits(self, qasm_file: Path) -> int:
         """Count qubits in QASM file"""
-        with open(qasm_file, 'r') as f:
-            for line in f:
-                if line.strip().startswith('qreg'):
-                    try:
-                        size = line.split('[')[1].split(']')[0]
-                        return int(size)
-                    except (IndexError, ValueError):
-                        pass
-        return 0
+        return _scan_qasm(qasm_file)[0]
     
-    def _save_results(self, results: List, filename: str):
-        """Save results to CSV"""
-        if not results:
-            return
+    def _save_result(self, result, filename: str):
+        """Append one result row to a CSV file, writing the header on first use
+
+        Called from the collecting thread only, in input-file order.
+        """
+        entry = self._csv_files.get(filename)
+        if entry is None:
+            names = [f.name for f in fields(result)]
+            f = open(self.output_dir / filename, 'w', newline='')
+            writer = csv.writer(f)
+            writer.writerow(names)
+            entry = self._csv_files[filename] = (f, writer, names)
         
-        output_file = self.output_dir / filename
-        with open(output_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=asdict(results[0]).keys())
-            writer.writeheader()
-            for result in results:
-                writer.writerow(asdict(result))
+        f, writer, names = entry
+        writer.writerow([getattr(result, n) for n in names])
+        # Flush per row so long sweeps can be monitored with `tail -f`
+        f.flush()
+    
+    def _close_results(self, filename: str):
+        """Finish a CSV file opened by _save_result"""
+        entry = self._csv_files.pop(filename, None)
+        if entry is None:
+            return
         
-        print(f"💾 Saved: {output_file}")
+        entry[0].close()
+        print(f"💾 Saved: {self.output_dir / filename}")
 
 
 def main():
@@ -321,6 +521,13 @@ def main():
                         help='Benchmark mode')
     parser.add_argument('--runs', type=int, default=10,
                         help='Number of runs for statistical analysis')
+    parser.add_argument('--no-serve', action='store_true',
+                        help='Spawn a new QNS process per run instead of reusing `qns serve`')
+    parser.add_argument('--outer-parallel', type=int, default=1, metavar='K',
+                        help='Number of QASM files to benchmark concurrently')
+    parser.add_argument('--parallel-runs', type=int, default=1, metavar='N',
+                        help='Overlap up to N timed runs of the same circuit. Faster, but the '
+                             'runs contend for CPU, so recorded timings are distorted (default: 1)')
     
     args = parser.parse_args()
     
@@ -333,20 +540,25 @@ def main():
     print(f"🔬 Found {len(qasm_files)} QASM circuits")
     print(f"📊 Statistical analysis: {args.runs} runs per circuit")
     
-    benchmark = QNSBenchmark(args.qns_binary, args.output_dir, num_runs=args.runs)
+    benchmark = QNSBenchmark(args.qns_binary, args.output_dir, num_runs=args.runs,
+                             use_server=not args.no_serve, outer_parallel=args.outer_parallel,
+                             parallel_runs=args.parallel_runs)
     
-    if args.mode in ['routing', 'all']:
-        print("\n" + "="*60)
-        print("🔀 ROUTING EFFICIENCY BENCHMARK")
-        print("="*60)
-        routing_results = benchmark.benchmark_routing_efficiency(qasm_files)
-    
-    if args.mode in ['simulation', 'all']:
-        print("\n" + "="*60)
-        print("⚡ SIMULATION PERFORMANCE BENCHMARK")
-        print("="*60)
-        qns_results, qiskit_results = benchmark.benchmark_simulation_performance(qasm_files)
-        benchmark.visualize_comparison(qns_results, qiskit_results)
+    try:
+        if args.mode in ['routing', 'all']:
+            print("\n" + "="*60)
+            print("🔀 ROUTING EFFICIENCY BENCHMARK")
+            print("="*60)
+            routing_results = benchmark.benchmark_routing_efficiency(qasm_files)
+        
+        if args.mode in ['simulation', 'all']:
+            print("\n" + "="*60)
+            print("⚡ SIMULATION PERFORMANCE BENCHMARK")
+            print("="*60)
+            qns_results, qiskit_results = benchmark.benchmark_simulation_performance(qasm_files)
+            benchmark.visualize_comparison(qns_results, qiskit_results)
+    finally:
+        benchmark.close()
     
     print("\n" + "="*60)
     print("✅ BENCHMARK COMPLETE!")
@@ -0,0 +1,37 @@
+"""
+Build all paper figures in a single Python process.
+
+Usage (from the repository root):
+    python -m scripts.figures
+"""
+
+import importlib
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+FIGURES = [
+    ('generate_fig1_pipeline', 'generate_fig1'),
+    ('generate_fig2_fidelity_model', 'generate_fig2'),
+    ('generate_fig3_benchmarks', 'generate_fig3'),
+    ('generate_fig4_scaling_zne', 'generate_fig4'),
+    ('generate_fig5_circuit_opt', 'generate_fig5'),
+]
+
+def main():
+    for module_name, func_name in FIGURES:
+        try:
+            module = importlib.import_module(f'.{module_name}', __package__)
+        except ImportError as e:
+            print(f"Skipped {module_name}: {e}")
+            continue
+
+        fig = getattr(module, func_name)()
+        fig.savefig(module.OUTPUT_PATH, dpi=300)
+        # Release the Agg canvas before building the next figure
+        plt.close(fig)
+        print(f"Generated {module.OUTPUT_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
-import matplotlib.pyplot as plt
-import networkx as nx
+OUTPUT_PATH = "docs/paper/figures/fig1_pipeline.png"
 
 def generate_fig1():
-    # Define the directed graph
-    G = nx.DiGraph()
-    
+    # Imported here so loading the module (e.g. for OUTPUT_PATH) stays cheap
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Circle
+
     # Define nodes with labels
     nodes = {
         'Calib': 'Calibration\n(IBM Backend)',
@@ -16,8 +16,6 @@ def generate_fig1():
         'ZNE': 'ZNE\nMitigation'
     }
     
-    G.add_nodes_from(nodes.keys())
-    
     # Define edges (Flow)
     edges = [
         ('Calib', 'Profile'),
@@ -29,8 +27,6 @@ def generate_fig1():
         ('ZNE', 'Compiler') # Feedback loop conceptual
     ]
     
-    G.add_edges_from(edges)
-    
     # Manual Layout for Schematic
     pos = {
         'Calib':    (0, 1),
@@ -42,26 +38,31 @@ def generate_fig1():
         'ZNE':      (3, 0)
     }
 
-    plt.figure(figsize=(10, 5))
+    fig, ax = plt.subplots(figsize=(10, 5))
     
-    # Draw Nodes
-    nx.draw_networkx_nodes(G, pos, node_size=3000, node_color='lightblue', edgecolors='black')
+    # Draw Nodes and Labels
+    circles = {}
+    for name, (x, y) in pos.items():
+        circles[name] = ax.add_patch(Circle((x, y), 0.25, fc='lightblue', ec='black', zorder=4))
+        ax.text(x, y, nodes[name], ha='center', va='center', fontsize=9, weight='bold', zorder=5)
     
-    # Draw Edges
-    nx.draw_networkx_edges(G, pos, edge_color='black', width=2, arrowsize=20, arrowstyle='->')
+    # Draw Edges (clipped to the node circles)
+    for a, b in edges:
+        ax.annotate('', xy=pos[b], xytext=pos[a],
+                    arrowprops=dict(arrowstyle='->', lw=2, color='black', mutation_scale=20,
+                                    patchA=circles[a], patchB=circles[b]))
     
-    # Draw Labels
-    labels = {k: v for k, v in nodes.items()}
-    nx.draw_networkx_labels(G, pos, labels, font_size=9, font_weight='bold')
+    ax.set_xlim(-0.5, 3.5)
+    ax.set_ylim(-0.5, 1.5)
+    ax.set_aspect('equal')
     
-    plt.title("Figure 1: QNS Optimization Pipeline", fontsize=14)
-    plt.axis('off')
-    plt.tight_layout()
+    ax.set_title("Figure 1: QNS Optimization Pipeline", fontsize=14)
+    ax.axis('off')
+    fig.tight_layout()
     
-    # Save
-    output_path = "docs/paper/figures/fig1_pipeline.png"
-    plt.savefig(output_path, dpi=300)
-    print(f"Generated {output_path}")
+    return fig
 
 if __name__ == "__main__":
-    generate_fig1()
+    fig = generate_fig1()
+    fig.savefig(OUTPUT_PATH, dpi=300)
+    print(f"Generated {OUTPUT_PATH}")
@@ -2,12 +2,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
 
+OUTPUT_PATH = "docs/paper/figures/fig2_fidelity_model.png"
+
 def generate_fig2():
     # Data Generation
     # X: T2 time (microseconds)
-    t2_vals = np.linspace(20, 100, 50) 
+    t2_vals = np.linspace(20, 100, 50, dtype=np.float32)
     # Y: Circuit Depth (number of gates, assuming 100ns per gate)
-    depth_vals = np.linspace(10, 200, 50)
+    depth_vals = np.linspace(10, 200, 50, dtype=np.float32)
     
     X, Y = np.meshgrid(t2_vals, depth_vals)
     
@@ -17,13 +19,16 @@ def generate_fig2():
     
     # Fidelity Model: F = (1 - epsilon)^depth * exp(-t_total / T2)
     # t_total = depth * gate_time
-    Z = np.power(1 - gate_error, Y) * np.exp(-(Y * gate_time_us) / X)
+    # Evaluated as a single exp: (1 - eps)^d = exp(d * log1p(-eps))
+    log_survival = np.float32(np.log1p(-gate_error))
+    Z = np.exp(Y * log_survival - (Y * gate_time_us) / X)
     
     # Plotting
     fig = plt.figure(figsize=(10, 7))
     ax = fig.add_subplot(111, projection='3d')
     
-    surf = ax.plot_surface(X, Y, Z, cmap=cm.viridis, linewidth=0, antialiased=False, alpha=0.9)
+    surf = ax.plot_surface(X, Y, Z, cmap=cm.viridis, linewidth=0, antialiased=False, alpha=0.9,
+                           rasterized=True)
     
     ax.set_xlabel('T2 Coherence Time (μs)')
     ax.set_ylabel('Circuit Depth (Gates)')
@@ -36,12 +41,11 @@ def generate_fig2():
     # View angle
     ax.view_init(elev=30, azim=135)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Save
-    output_path = "docs/paper/figures/fig2_fidelity_model.png"
-    plt.savefig(output_path, dpi=300)
-    print(f"Generated {output_path}")
+    return fig
 
 if __name__ == "__main__":
-    generate_fig2()
+    fig = generate_fig2()
+    fig.savefig(OUTPUT_PATH, dpi=300)
+    print(f"Generated {OUTPUT_PATH}")
@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+OUTPUT_PATH = "docs/paper/figures/fig3_benchmarks.png"
+
 def generate_fig3():
     # Data from QNS_Technical_Specification_v2.5.md
     circuits = ['QFT-10', 'QFT-15', 'Grover-10']
@@ -52,10 +54,10 @@ def generate_fig3():
     ax2.bar_label(rects4, padding=3, fmt='%.3f')
     ax2.bar_label(rects5, padding=3, fmt='%.3f')
     
-    plt.tight_layout()
-    output_path = "docs/paper/figures/fig3_benchmarks.png"
-    plt.savefig(output_path, dpi=300)
-    print(f"Generated {output_path}")
+    fig.tight_layout()
+    return fig
 
 if __name__ == "__main__":
-    generate_fig3()
+    fig = generate_fig3()
+    fig.savefig(OUTPUT_PATH, dpi=300)
+    print(f"Generated {OUTPUT_PATH}")
@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.optimize import curve_fit
+
+OUTPUT_PATH = "docs/paper/figures/fig4_scaling_zne.png"
 
 def generate_fig4():
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
@@ -33,22 +34,20 @@ def generate_fig4():
     noise_factors = np.array([1, 3, 5])
     expectations = np.array([0.85, 0.72, 0.61]) # Mock noisy data
     
-    # Linear Fit
-    def linear_model(x, a, b): return a*x + b
-    popt_lin, _ = curve_fit(linear_model, noise_factors, expectations)
+    # Linear Fit (closed-form least squares)
+    popt_lin = np.polyfit(noise_factors, expectations, 1)
     
     # Richardson (Quadratic for 3 points)
-    def poly2_model(x, a, b, c): return a*x**2 + b*x + c
-    popt_rich, _ = curve_fit(poly2_model, noise_factors, expectations)
+    popt_rich = np.polyfit(noise_factors, expectations, 2)
     
     # Extrapolation
     x_extrap = np.linspace(0, 5.5, 50)
-    y_lin = linear_model(x_extrap, *popt_lin)
-    y_rich = poly2_model(x_extrap, *popt_rich)
+    y_lin = np.polyval(popt_lin, x_extrap)
+    y_rich = np.polyval(popt_rich, x_extrap)
     
     # Zero-noise Points
-    zero_lin = linear_model(0, *popt_lin)
-    zero_rich = poly2_model(0, *popt_rich)
+    zero_lin = np.polyval(popt_lin, 0)
+    zero_rich = np.polyval(popt_rich, 0)
     
     ax2.scatter(noise_factors, expectations, color='black', label='Measured ($E(\lambda)$)')
     ax2.plot(x_extrap, y_lin, '--', color='blue', label=f'Linear (E(0)={zero_lin:.3f})')
@@ -64,10 +63,10 @@ def generate_fig4():
     ax2.legend()
     ax2.grid(True, alpha=0.5)
     
-    plt.tight_layout()
-    output_path = "docs/paper/figures/fig4_scaling_zne.png"
-    plt.savefig(output_path, dpi=300)
-    print(f"Generated {output_path}")
+    fig.tight_layout()
+    return fig
 
 if __name__ == "__main__":
-    generate_fig4()
+    fig = generate_fig4()
+    fig.savefig(OUTPUT_PATH, dpi=300)
+    print(f"Generated {OUTPUT_PATH}")
@@ -1,6 +1,8 @@
 from qiskit import QuantumCircuit
 import matplotlib.pyplot as plt
 
+OUTPUT_PATH = "docs/paper/figures/fig5_circuit_opt.png"
+
 def generate_fig5():
     # 1. Original Circuit (Inefficient routing)
     qc_orig = QuantumCircuit(3)
@@ -34,10 +36,10 @@ def generate_fig5():
     qc_opt.draw(output='mpl', ax=ax2, style='iqp')
     ax2.set_title("(b) QNS Optimized (Physical)", fontsize=12)
     
-    plt.tight_layout()
-    output_path = "docs/paper/figures/fig5_circuit_opt.png"
-    plt.savefig(output_path, dpi=300)
-    print(f"Generated {output_path}")
+    fig.tight_layout()
+    return fig
 
 if __name__ == "__main__":
-    generate_fig5()
+    fig = generate_fig5()
+    fig.savefig(OUTPUT_PATH, dpi=300)
+    print(f"Generated {OUTPUT_PATH}")
@@ -11,15 +11,20 @@ Usage:
 """
 
 import json
-import csv
 import argparse
+import functools
+import multiprocessing
+import os
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Dict, Optional, Tuple
 import sys
 
 try:
-    import matplotlib.pyplot as plt
+    import matplotlib
+    from matplotlib import font_manager
     import matplotlib.patches as mpatches
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     import numpy as np
     HAS_MATPLOTLIB = True
 except ImportError:
@@ -31,7 +36,8 @@ except ImportError:
 STYLE = {
     'figure.figsize': (8, 5),
     'font.size': 11,
-    'font.family': 'serif',
+    # A concrete family (bundled with matplotlib) skips the generic 'serif' fallback search
+    'font.family': 'DejaVu Serif',
     'axes.labelsize': 12,
     'axes.titlesize': 13,
     'xtick.labelsize': 10,
@@ -41,16 +47,27 @@ STYLE = {
     'grid.alpha': 0.3,
     'axes.spines.top': False,
     'axes.spines.right': False,
+    # Embed TrueType fonts directly rather than converting them to Type 3
+    'pdf.fonttype': 42,
 }
 
+if HAS_MATPLOTLIB:
+    matplotlib.rcParams.update(STYLE)
 
-def load_csv(filepath: Path) -> List[Dict]:
-    """Load CSV file into list of dictionaries"""
+
+@functools.lru_cache(maxsize=32)
+def _load_csv_arrays_cached(path: str, mtime_ns: int) -> Optional["np.ndarray"]:
+    arr = np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8')
+    # A single data row comes back as a 0-d array
+    arr = np.atleast_1d(arr)
+    return arr if arr.size else None
+
+
+def load_csv_arrays(filepath: Path) -> Optional["np.ndarray"]:
+    """Load CSV file into a structured array with typed columns, or None if missing/empty"""
     if not filepath.exists():
-        return []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+        return None
+    return _load_csv_arrays_cached(str(filepath), filepath.stat().st_mtime_ns)
 
 
 def load_json(filepath: Path) -> Dict:
@@ -61,75 +78,89 @@ def load_json(filepath: Path) -> Dict:
         return json.load(f)
 
 
-def plot_fidelity_comparison(data: List[Dict], output_path: Path):
+def _save_figure(fig: "Figure", output_path: Path, name: str):
+    """Save a figure as <name>.pdf and <name>.png"""
+    # Constrained layout already fits the artists, so bbox_inches='tight' (an
+    # extra draw per file) is unnecessary; the layout solved for the PDF is
+    # then frozen so the PNG pass only draws. The PDF is pure vector output,
+    # so it takes no dpi.
+    fig.savefig(output_path / f'{name}.pdf')
+    if hasattr(fig, 'set_layout_engine'):
+        fig.set_layout_engine('none')
+    else:  # matplotlib < 3.6
+        fig.set_constrained_layout(False)
+    fig.savefig(output_path / f'{name}.png', dpi=150)
+    print(f"Generated: {output_path / f'{name}.pdf'}")
+
+
+def _grouped_bar(ax, labels, series: Dict[str, list], colors: list, **tick_kw) -> list:
+    """Draw one bar per series side by side at each label; returns the bar containers"""
+    width = 0.35
+    x = np.arange(len(labels))
+    offsets = (np.arange(len(series)) - (len(series) - 1) / 2) * width
+    containers = [ax.bar(x + offset, values, width, label=name, color=color, alpha=0.8)
+                  for offset, (name, values), color in zip(offsets, series.items(), colors)]
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, **tick_kw)
+    return containers
+
+
+def plot_fidelity_comparison(data: Optional["np.ndarray"], output_path: Path):
     """
     Figure 1: Bar chart comparing original vs optimized fidelity
     """
-    if not data:
+    if data is None:
         print("[WARN] No data for fidelity comparison plot")
         return
 
-    plt.rcParams.update(STYLE)
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6), layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     # Extract data
-    circuits = [d['circuit_name'].split('_')[0] for d in data[:8]]  # First 8 circuits
-    original = [float(d['original_fidelity']) for d in data[:8]]
-    optimized = [float(d['optimized_fidelity']) for d in data[:8]]
-
-    x = np.arange(len(circuits))
-    width = 0.35
+    circuits = [name.split('_')[0] for name in data['circuit_name']]
+    original = data['original_fidelity']
+    optimized = data['optimized_fidelity']
 
-    bars1 = ax.bar(x - width/2, original, width, label='Original', color='#2196F3', alpha=0.8)
-    bars2 = ax.bar(x + width/2, optimized, width, label='QNS Optimized', color='#4CAF50', alpha=0.8)
+    bars1, _ = _grouped_bar(ax, circuits, {'Original': original, 'QNS Optimized': optimized},
+                            ['#2196F3', '#4CAF50'], rotation=45, ha='right')
 
     ax.set_ylabel('Estimated Fidelity')
     ax.set_xlabel('Circuit')
     ax.set_title('QNS Noise-Adaptive Optimization: Fidelity Comparison')
-    ax.set_xticks(x)
-    ax.set_xticklabels(circuits, rotation=45, ha='right')
     ax.legend()
     ax.set_ylim(0.7, 1.0)
 
     # Add value labels
-    for bar in bars1:
-        height = bar.get_height()
-        ax.annotate(f'{height:.3f}',
-                   xy=(bar.get_x() + bar.get_width() / 2, height),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=8)
+    ax.bar_label(bars1, fmt='%.3f', padding=3, fontsize=8)
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig1_fidelity_comparison.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig1_fidelity_comparison.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig1_fidelity_comparison.pdf'}")
+    _save_figure(fig, output_path, 'fig1_fidelity_comparison')
 
 
-def plot_improvement_by_noise(data: List[Dict], output_path: Path):
+def plot_improvement_by_noise(data: Optional["np.ndarray"], output_path: Path):
     """
     Figure 2: Improvement percentage by noise level
     """
-    if not data:
+    if data is None:
         return
 
-    plt.rcParams.update(STYLE)
-    fig, ax = plt.subplots(figsize=(8, 5))
-
-    # Group by noise level
-    noise_levels = {'low': [], 'medium': [], 'high': []}
-    for d in data:
-        name = d['circuit_name']
-        improvement = float(d['improvement_percent'])
-        if 'low_noise' in name:
-            noise_levels['low'].append(improvement)
-        elif 'medium_noise' in name:
-            noise_levels['medium'].append(improvement)
-        elif 'high_noise' in name:
-            noise_levels['high'].append(improvement)
+    fig = Figure(figsize=(8, 5), layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    # Group by noise level: label each record 0/1/2 (3 = unmatched), assigning
+    # in reverse so the first matching level wins, then split one sorted pass
+    names = data['circuit_name'].astype(str)
+    levels = ('low_noise', 'medium_noise', 'high_noise')
+    labels = np.full(len(names), len(levels))
+    for level in reversed(range(len(levels))):
+        labels[np.char.find(names, levels[level]) >= 0] = level
+    order = np.argsort(labels, kind='stable')
+    groups = np.split(data['improvement_percent'][order],
+                      np.searchsorted(labels[order], np.arange(1, len(levels) + 1)))
 
     # Create box plot
-    box_data = [noise_levels['low'], noise_levels['medium'], noise_levels['high']]
+    box_data = groups[:len(levels)]
     bp = ax.boxplot(box_data, labels=['Low Noise\n(T1=300us)', 'Medium Noise\n(T1=100us)', 'High Noise\n(T1=50us)'],
                     patch_artist=True)
 
@@ -143,19 +174,16 @@ def plot_improvement_by_noise(data: List[Dict], output_path: Path):
     ax.set_title('QNS Optimization Improvement vs Noise Level')
     ax.axhline(y=0, color='gray', linestyle='--', linewidth=0.8)
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig2_improvement_by_noise.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig2_improvement_by_noise.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig2_improvement_by_noise.pdf'}")
+    _save_figure(fig, output_path, 'fig2_improvement_by_noise')
 
 
 def plot_ablation_study(output_path: Path):
     """
     Figure 3: Ablation study pie chart
     """
-    plt.rcParams.update(STYLE)
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig = Figure(figsize=(8, 6), layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     # Ablation study data from previous results (updated values)
     components = ['Placement\nOptimization', 'Scoring\nFunction', 'Gate\nReordering']
@@ -175,70 +203,62 @@ def plot_ablation_study(output_path: Path):
 
     ax.set_title('QNS Component Contribution Analysis\n(Ablation Study)', fontsize=14)
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig3_ablation_study.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig3_ablation_study.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig3_ablation_study.pdf'}")
+    _save_figure(fig, output_path, 'fig3_ablation_study')
 
 
-def plot_optimization_time(data: List[Dict], output_path: Path):
+def plot_optimization_time(data: Optional["np.ndarray"], output_path: Path):
     """
     Figure 4: Optimization time vs circuit size
     """
-    if not data:
+    if data is None:
         return
 
-    plt.rcParams.update(STYLE)
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig = Figure(figsize=(8, 5), layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
-    gates = [int(d['num_gates']) for d in data]
-    times = [float(d['optimization_time_ms']) for d in data]
+    gates = data['num_gates']
+    times = data['optimization_time_ms']
 
-    ax.scatter(gates, times, alpha=0.6, s=60, c='#2196F3', edgecolors='white', linewidth=0.5)
+    ax.scatter(gates, times, alpha=0.6, s=60, c='#2196F3', edgecolors='white', linewidth=0.5,
+               rasterized=False)
 
-    # Fit and plot trend line
-    if len(gates) > 2:
-        z = np.polyfit(gates, times, 1)
-        p = np.poly1d(z)
-        x_line = np.linspace(min(gates), max(gates), 100)
-        ax.plot(x_line, p(x_line), '--', color='#E53935', alpha=0.7, label='Linear trend')
+    # Fit and plot trend line (closed-form least squares; a line needs only its endpoints)
+    dg = gates - gates.mean()
+    sxx = dg @ dg
+    if len(gates) > 2 and sxx > 0:
+        slope = (dg @ (times - times.mean())) / sxx
+        intercept = times.mean() - slope * gates.mean()
+        x_line = np.array([gates.min(), gates.max()])
+        ax.plot(x_line, slope * x_line + intercept, '--', color='#E53935', alpha=0.7, label='Linear trend')
 
     ax.set_xlabel('Number of Gates')
     ax.set_ylabel('Optimization Time (ms)')
     ax.set_title('QNS Optimization Scalability')
     ax.legend()
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig4_optimization_time.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig4_optimization_time.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig4_optimization_time.pdf'}")
+    _save_figure(fig, output_path, 'fig4_optimization_time')
 
 
 def plot_e2e_validation(output_path: Path):
     """
     Figure 5: E2E Validation - Analytical vs Simulated
     """
-    plt.rcParams.update(STYLE)
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig = Figure(figsize=(8, 5), layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     # E2E validation data (from benchmark output)
     strategies = ['Identity\n(baseline)', 'Placement\nOptimized', 'Co-optimization']
     analytical = [25.0, 95.0, 95.0]
     simulated = [47.0, 95.0, 94.0]
 
-    x = np.arange(len(strategies))
-    width = 0.35
-
-    bars1 = ax.bar(x - width/2, analytical, width, label='Analytical Estimate', color='#2196F3', alpha=0.8)
-    bars2 = ax.bar(x + width/2, simulated, width, label='Monte Carlo Simulation', color='#4CAF50', alpha=0.8)
+    _grouped_bar(ax, strategies, {'Analytical Estimate': analytical, 'Monte Carlo Simulation': simulated},
+                 ['#2196F3', '#4CAF50'])
 
     ax.set_ylabel('Fidelity (%)')
     ax.set_xlabel('Optimization Strategy')
     ax.set_title('E2E Validation: Analytical vs Monte Carlo\n(5 CNOTs on worst edge)')
-    ax.set_xticks(x)
-    ax.set_xticklabels(strategies)
     ax.legend(loc='lower right')
     ax.set_ylim(0, 100)
 
@@ -247,11 +267,7 @@ def plot_e2e_validation(output_path: Path):
                arrowprops=dict(arrowstyle='->', color='red', lw=2))
     ax.text(1, 60, '+70%\nimprovement', ha='center', fontsize=11, color='red', fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig5_e2e_validation.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig5_e2e_validation.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig5_e2e_validation.pdf'}")
+    _save_figure(fig, output_path, 'fig5_e2e_validation')
 
 
 def plot_placement_optimization(output_path: Path):
@@ -259,25 +275,21 @@ def plot_placement_optimization(output_path: Path):
     Figure 6: Placement Optimization - Route Through Better Edges
     Shows dramatic improvement when routing through better edges
     """
-    plt.rcParams.update(STYLE)
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6), layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     # Data from placement_benchmark results (corrected values)
     scenarios = ['10 CNOTs\n(worst edge)', '5+3 CNOTs\n(mixed)', '5 CNOTs\n(best edge)']
     identity = [32.1, 61.58, 95.0]   # Identity mapping fidelity (%)
     optimized = [90.0, 61.58, 95.0]  # Optimized mapping fidelity (%)
 
-    x = np.arange(len(scenarios))
-    width = 0.35
-
-    bars1 = ax.bar(x - width/2, identity, width, label='Identity Mapping', color='#E57373', alpha=0.8)
-    bars2 = ax.bar(x + width/2, optimized, width, label='QNS Optimized', color='#4CAF50', alpha=0.8)
+    _, bars2 = _grouped_bar(ax, scenarios, {'Identity Mapping': identity, 'QNS Optimized': optimized},
+                            ['#E57373', '#4CAF50'])
 
     ax.set_ylabel('Estimated Fidelity (%)')
     ax.set_xlabel('Circuit Scenario')
     ax.set_title('Placement Optimization: Route-Through-Better-Edges\n(Linear 4-qubit: Q0─99%─Q1─90%─Q2─95%─Q3)')
-    ax.set_xticks(x)
-    ax.set_xticklabels(scenarios)
     ax.legend(loc='lower right')
     ax.set_ylim(0, 105)
 
@@ -286,26 +298,18 @@ def plot_placement_optimization(output_path: Path):
                 ha='center', va='bottom', fontsize=14, color='green', fontweight='bold')
 
     # Add value labels
-    for bar in bars2:
-        height = bar.get_height()
-        ax.annotate(f'{height:.0f}%',
-                   xy=(bar.get_x() + bar.get_width() / 2, height),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars2, fmt='%.0f%%', padding=3, fontsize=10, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig6_placement_optimization.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig6_placement_optimization.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig6_placement_optimization.pdf'}")
+    _save_figure(fig, output_path, 'fig6_placement_optimization')
 
 
 def plot_e2e_comparison(output_path: Path):
     """
     Figure 7: E2E Validation - All test cases
     """
-    plt.rcParams.update(STYLE)
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    fig = Figure(figsize=(12, 5), layout='constrained')
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(1, 2)
 
     # Test case 1: 5 CNOTs on worst edge (main result)
     ax1 = axes[0]
@@ -313,15 +317,10 @@ def plot_e2e_comparison(output_path: Path):
     analytical = [25.0, 95.0, 95.0]
     simulated = [33.0, 93.0, 94.0]
 
-    x = np.arange(len(strategies))
-    width = 0.35
-
-    ax1.bar(x - width/2, analytical, width, label='Analytical', color='#2196F3', alpha=0.8)
-    ax1.bar(x + width/2, simulated, width, label='Monte Carlo', color='#FF9800', alpha=0.8)
+    _grouped_bar(ax1, strategies, {'Analytical': analytical, 'Monte Carlo': simulated},
+                 ['#2196F3', '#FF9800'])
     ax1.set_ylabel('Fidelity (%)')
     ax1.set_title('Test 1: 5 CNOTs on Worst Edge')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(strategies)
     ax1.legend()
     ax1.set_ylim(0, 105)
     ax1.axhline(y=90, color='green', linestyle='--', alpha=0.5, label='90% threshold')
@@ -337,21 +336,19 @@ def plot_e2e_comparison(output_path: Path):
     identity_sim = [33, 99.99, 64, 70]
     optimized_sim = [93, 99.99, 69, 73]
 
-    x = np.arange(len(test_cases))
-    ax2.bar(x - width/2, identity_sim, width, label='Identity', color='#E57373', alpha=0.8)
-    ax2.bar(x + width/2, optimized_sim, width, label='Optimized', color='#4CAF50', alpha=0.8)
+    _grouped_bar(ax2, test_cases, {'Identity': identity_sim, 'Optimized': optimized_sim},
+                 ['#E57373', '#4CAF50'])
     ax2.set_ylabel('Simulated Fidelity (%)')
     ax2.set_title('Monte Carlo Simulation Results')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(test_cases)
     ax2.legend()
     ax2.set_ylim(0, 105)
 
-    plt.tight_layout()
-    plt.savefig(output_path / 'fig7_e2e_all_cases.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig(output_path / 'fig7_e2e_all_cases.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Generated: {output_path / 'fig7_e2e_all_cases.pdf'}")
+    _save_figure(fig, output_path, 'fig7_e2e_all_cases')
+
+
+def _render_one(plot, args: Tuple):
+    """Pool worker: draw a single figure"""
+    plot(*args)
 
 
 def generate_all_figures(input_dir: Path, output_dir: Path):
@@ -366,20 +363,25 @@ def generate_all_figures(input_dir: Path, output_dir: Path):
     print("QNS Paper Figure Generator")
     print("=" * 60)
 
-    # Load data
-    fidelity_data = load_csv(input_dir / 'fidelity_benchmark.csv')
-    placement_data = load_csv(input_dir / 'placement_results.csv')
-    e2e_data = load_csv(input_dir / 'e2e_validation_results.csv')
+    # Load data (fig1 only charts the first 8 circuits)
+    fidelity_data = load_csv_arrays(input_dir / 'fidelity_benchmark.csv')
+    fidelity_head = fidelity_data[:8] if fidelity_data is not None else None
 
-    # Generate figures
+    # Generate figures: they are independent, so render them in parallel
     print("\nGenerating figures...")
-    plot_fidelity_comparison(fidelity_data, output_dir)
-    plot_improvement_by_noise(fidelity_data, output_dir)
-    plot_ablation_study(output_dir)
-    plot_optimization_time(fidelity_data, output_dir)
-    plot_e2e_validation(output_dir)
-    plot_placement_optimization(output_dir)
-    plot_e2e_comparison(output_dir)
+    tasks = [
+        (plot_fidelity_comparison, (fidelity_head, output_dir)),
+        (plot_improvement_by_noise, (fidelity_data, output_dir)),
+        (plot_ablation_study, (output_dir,)),
+        (plot_optimization_time, (fidelity_data, output_dir)),
+        (plot_e2e_validation, (output_dir,)),
+        (plot_placement_optimization, (output_dir,)),
+        (plot_e2e_comparison, (output_dir,)),
+    ]
+    # Resolve the font once here so forked workers inherit the cached lookup
+    font_manager.findfont(STYLE['font.family'])
+    with multiprocessing.Pool(processes=min(len(tasks), os.cpu_count() or 1)) as pool:
+        pool.starmap(_render_one, tasks)
 
     print("\n" + "=" * 60)
     print(f"Figures saved to: {output_dir.absolute()}")
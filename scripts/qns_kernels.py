@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+QNS numeric kernels
+
+The kernels are plain Python loops written for Numba. Scripts JIT them with
+numba.njit(cache=True) when numba is installed, so the compiled code is
+reused across runs, and fall back to NumPy otherwise.
+"""
+
+import math
+
+
+def cohens_d(baseline, optimized):
+    """Paired Cohen's d without materialising the difference array
+
+    Two passes (mean, then squared deviations) rather than sum/sum-of-squares,
+    which cancels catastrophically when the mean difference dwarfs its spread.
+    """
+    n = baseline.size
+    if n < 2:
+        return 0.0
+    s = 0.0
+    for i in range(n):
+        s += optimized[i] - baseline[i]
+    mean = s / n
+    ss = 0.0
+    for i in range(n):
+        d = optimized[i] - baseline[i] - mean
+        ss += d * d
+    var = ss / (n - 1)
+    return mean / math.sqrt(var) if var > 0 else 0.0
@@ -16,14 +16,42 @@ Usage:
 import subprocess
 import json
 import argparse
+import importlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from scipy import stats
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 import sys
 
-@dataclass
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _import_sibling(name: str):
+    """Import a module next to this file, whether run as a script or imported as scripts.<module>"""
+    if __package__:
+        return importlib.import_module(f'.{name}', __package__)
+    return importlib.import_module(name)
+
+
+# numba is optional (see requirements.txt): it JITs the qns_kernels source,
+# caching the compiled code on disk. NUMBA_AVAILABLE False means
+# calculate_cohens_d uses plain NumPy.
+try:
+    from numba import njit
+    _cohens_d_kernel = njit(cache=True, fastmath=True)(_import_sibling('qns_kernels').cohens_d)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+@dataclass(slots=True)
 class BenchmarkRun:
     """Single benchmark run result"""
     circuit_name: str
@@ -32,7 +60,7 @@ class BenchmarkRun:
     improvement: float
     optimization_time_ms: float
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalResult:
     """Statistical analysis result for a circuit"""
     circuit_name: str
@@ -71,8 +99,39 @@ class StatisticalResult:
     is_significant_01: bool   # p < 0.10
 
 
-def run_rust_benchmark(runs: int = 10) -> List[BenchmarkRun]:
-    """Run Rust fidelity benchmark and parse results"""
+def _run_rust_benchmark_inprocess(runs: int) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+    """Call the compiled qns extension directly; None if it is not installed
+
+    The circuit x noise matrix comes from the Rust side (the same set the
+    cargo example runs), keyed the same way ("<circuit>_<noise>").
+    """
+    try:
+        import qns
+        bench_fidelity = qns.bench_fidelity
+        cases = qns.fidelity_benchmark_cases()
+    except (ImportError, AttributeError):
+        return None
+
+    results = {}
+    for key, circuit, noise in cases:
+        # (runs, 4): baseline, optimized, improvement, time_ms
+        rows = np.asarray(bench_fidelity(circuit, noise, runs), dtype=np.float64).reshape(-1, 4)
+        results[key] = {
+            "baseline": rows[:, 0],
+            "optimized": rows[:, 1],
+            "improvement": rows[:, 2],
+            "time_ms": rows[:, 3],
+        }
+    return results
+
+
+def run_rust_benchmark(runs: int = 10) -> Dict[str, Dict[str, np.ndarray]]:
+    """Run Rust fidelity benchmark and return per-circuit columns"""
+
+    # Prefer the PyO3 extension: no cargo invocation, no JSON round-trip
+    results = _run_rust_benchmark_inprocess(runs)
+    if results is not None:
+        return results
 
     # Run the benchmark with JSON output
     cmd = [
@@ -92,14 +151,14 @@ def run_rust_benchmark(runs: int = 10) -> List[BenchmarkRun]:
 
         if result.returncode != 0:
             print(f"Benchmark failed: {result.stderr}", file=sys.stderr)
-            return []
+            return {}
 
         # Parse JSON output (stdout)
         data = json.loads(result.stdout)
 
-        results = []
+        by_circuit: Dict[str, List[BenchmarkRun]] = {}
         for r in data.get("results", []):
-            results.append(BenchmarkRun(
+            by_circuit.setdefault(r["circuit"], []).append(BenchmarkRun(
                 circuit_name=r["circuit"],
                 baseline_fidelity=r["original_fidelity"],
                 optimized_fidelity=r["optimized_fidelity"],
@@ -107,19 +166,22 @@ def run_rust_benchmark(runs: int = 10) -> List[BenchmarkRun]:
                 optimization_time_ms=r["optimization_time_ms"]
             ))
 
-        return results
+        return {name: runs_to_columns(circuit_runs) for name, circuit_runs in by_circuit.items()}
 
     except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError) as e:
         print(f"Error running benchmark: {e}", file=sys.stderr)
-        return []
+        return {}
 
 
-def simulate_benchmark_data(runs: int = 100) -> Dict[str, List[BenchmarkRun]]:
+def simulate_benchmark_data(runs: int = 100) -> Dict[str, Dict[str, np.ndarray]]:
     """
     Simulate benchmark data for testing statistical analysis.
     In production, this would be replaced by actual multi-run benchmarks.
+
+    Returns per-circuit columns (struct-of-arrays) keyed by
+    'baseline', 'optimized', 'improvement' and 'time_ms'.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     circuits = {
         "ghz_n4": {"baseline": 0.92, "improvement": 0.03, "std": 0.01},
@@ -132,77 +194,82 @@ def simulate_benchmark_data(runs: int = 100) -> Dict[str, List[BenchmarkRun]]:
     results = {}
 
     for circuit_name, params in circuits.items():
-        circuit_runs = []
-        for _ in range(runs):
-            baseline = params["baseline"] + np.random.normal(0, params["std"])
-            improvement = params["improvement"] + np.random.normal(0, params["std"] * 0.5)
-            improvement = max(0, improvement)  # Ensure non-negative
-
-            circuit_runs.append(BenchmarkRun(
-                circuit_name=circuit_name,
-                baseline_fidelity=baseline,
-                optimized_fidelity=baseline + improvement,
-                improvement=improvement,
-                optimization_time_ms=np.random.uniform(0.5, 2.0)
-            ))
-
-        results[circuit_name] = circuit_runs
+        # Draw every run for the circuit in one batch per quantity
+        baseline = params["baseline"] + rng.standard_normal(runs) * params["std"]
+        improvement = params["improvement"] + rng.standard_normal(runs) * (params["std"] * 0.5)
+        improvement = np.maximum(0, improvement)  # Ensure non-negative
+
+        results[circuit_name] = {
+            "baseline": baseline,
+            "optimized": baseline + improvement,
+            "improvement": improvement,
+            "time_ms": rng.uniform(0.5, 2.0, runs),
+        }
 
     return results
 
 
-def calculate_confidence_interval(data: np.ndarray, confidence: float = 0.95) -> Tuple[float, float]:
-    """Calculate confidence interval using t-distribution"""
-    n = len(data)
-    mean = np.mean(data)
-    se = stats.sem(data)
-    h = se * stats.t.ppf((1 + confidence) / 2, n - 1)
-    return mean - h, mean + h
-
-
-def calculate_cohens_d(baseline: np.ndarray, optimized: np.ndarray) -> float:
-    """Calculate Cohen's d effect size for paired samples"""
-    diff = optimized - baseline
-    return np.mean(diff) / np.std(diff, ddof=1) if np.std(diff) > 0 else 0.0
-
+@lru_cache(maxsize=32)
+def _t_ppf(n: int, confidence: float) -> float:
+    """Two-sided critical t value for n samples (cached, identical across circuits)"""
+    return stats.t.ppf((1 + confidence) / 2, n - 1)
 
-def analyze_circuit(circuit_name: str, runs: List[BenchmarkRun]) -> StatisticalResult:
-    """Perform statistical analysis on benchmark runs for a single circuit"""
 
-    baselines = np.array([r.baseline_fidelity for r in runs])
-    optimized = np.array([r.optimized_fidelity for r in runs])
-    improvements = np.array([r.improvement for r in runs])
+def _stats_pass(arr: np.ndarray, confidence: float = 0.95) -> Tuple[float, float, float, float]:
+    """Mean, sample std and t-based CI bounds
 
-    n = len(runs)
+    Reduces over the last axis, so a (circuits, runs) array yields one value
+    per circuit.
+    """
+    n = arr.shape[-1]
+    # Two-pass variance (NumPy's var) on data shifted by the first run: the
+    # sum-of-squares form cancels on low-spread data, and the shift makes a
+    # constant column exactly zero so its std and CI width come out as 0
+    shifted = arr - arr[..., :1]
+    mean = arr[..., 0] + shifted.mean(axis=-1)
+    std = np.sqrt(shifted.var(axis=-1, ddof=1))
+    h = std / np.sqrt(n) * _t_ppf(n, confidence)
+    return mean, std, mean - h, mean + h
 
-    # Calculate means and stds
-    baseline_mean = np.mean(baselines)
-    baseline_std = np.std(baselines, ddof=1)
-    optimized_mean = np.mean(optimized)
-    optimized_std = np.std(optimized, ddof=1)
-    improvement_mean = np.mean(improvements)
-    improvement_std = np.std(improvements, ddof=1)
 
-    # Confidence intervals
-    baseline_ci = calculate_confidence_interval(baselines)
-    optimized_ci = calculate_confidence_interval(optimized)
-    improvement_ci = calculate_confidence_interval(improvements)
+def calculate_cohens_d(baseline: np.ndarray, optimized: np.ndarray) -> float:
+    """Calculate Cohen's d effect size for paired samples"""
+    if not NUMBA_AVAILABLE:
+        # Interpreted, the kernel's loop is far slower than NumPy's vectorized passes
+        diff = optimized - baseline
+        if diff.size < 2:
+            return 0.0
+        std = diff.std(ddof=1)
+        return float(diff.mean() / std) if std > 0 else 0.0
+    return float(_cohens_d_kernel(np.ascontiguousarray(baseline, dtype=np.float64),
+                                  np.ascontiguousarray(optimized, dtype=np.float64)))
+
+
+def runs_to_columns(runs: List[BenchmarkRun]) -> Dict[str, np.ndarray]:
+    """Convert a list of BenchmarkRun records into the column layout used by analyze_circuit"""
+    return {
+        "baseline": np.array([r.baseline_fidelity for r in runs]),
+        "optimized": np.array([r.optimized_fidelity for r in runs]),
+        "improvement": np.array([r.improvement for r in runs]),
+        "time_ms": np.array([r.optimization_time_ms for r in runs]),
+    }
 
-    # Paired t-test (H0: improvement = 0, H1: improvement > 0)
-    t_stat, t_pvalue = stats.ttest_rel(optimized, baselines)
-    # One-sided: divide by 2 if t_stat > 0
-    if t_stat > 0:
-        t_pvalue = t_pvalue / 2
 
-    # Wilcoxon signed-rank test (non-parametric)
+def _wilcoxon_greater(improvements: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+    """One-sided Wilcoxon signed-rank test, (None, None) when it cannot be computed"""
     try:
-        w_stat, w_pvalue = stats.wilcoxon(improvements, alternative='greater')
+        return stats.wilcoxon(improvements, alternative='greater')
     except ValueError:
         # All zeros or insufficient data
-        w_stat, w_pvalue = None, None
+        return None, None
 
-    # Cohen's d effect size
-    cohens_d = calculate_cohens_d(baselines, optimized)
+
+def _make_result(circuit_name: str, n: int, baseline, optimized, improvement,
+                 t_stat, t_pvalue, w_stat, w_pvalue, cohens_d) -> StatisticalResult:
+    """Assemble a StatisticalResult from (mean, std, ci_lo, ci_hi) tuples and test outputs"""
+    baseline_mean, baseline_std, *baseline_ci = baseline
+    optimized_mean, optimized_std, *optimized_ci = optimized
+    improvement_mean, improvement_std, *improvement_ci = improvement
 
     return StatisticalResult(
         circuit_name=circuit_name,
@@ -224,12 +291,80 @@ def analyze_circuit(circuit_name: str, runs: List[BenchmarkRun]) -> StatisticalR
         wilcoxon_statistic=w_stat,
         wilcoxon_pvalue=w_pvalue,
         cohens_d=cohens_d,
-        is_significant_001=t_pvalue < 0.001 if t_pvalue else False,
-        is_significant_005=t_pvalue < 0.05 if t_pvalue else False,
-        is_significant_01=t_pvalue < 0.10 if t_pvalue else False,
+        is_significant_001=bool(t_pvalue < 0.001) if t_pvalue else False,
+        is_significant_005=bool(t_pvalue < 0.05) if t_pvalue else False,
+        is_significant_01=bool(t_pvalue < 0.10) if t_pvalue else False,
     )
 
 
+def analyze_circuit(circuit_name: str, runs: Dict[str, np.ndarray]) -> StatisticalResult:
+    """Perform statistical analysis on benchmark runs (as columns) for a single circuit"""
+
+    baselines = runs["baseline"]
+    optimized = runs["optimized"]
+    improvements = runs["improvement"]
+
+    n = len(baselines)
+
+    # Paired t-test (H0: improvement = 0, H1: improvement > 0)
+    t_stat, t_pvalue = stats.ttest_rel(optimized, baselines, alternative='greater')
+
+    # Wilcoxon signed-rank test (non-parametric)
+    w_stat, w_pvalue = _wilcoxon_greater(improvements)
+
+    # Cohen's d effect size
+    cohens_d = calculate_cohens_d(baselines, optimized)
+
+    # Means, stds and confidence intervals
+    return _make_result(
+        circuit_name, n,
+        _stats_pass(baselines), _stats_pass(optimized), _stats_pass(improvements),
+        t_stat, t_pvalue, w_stat, w_pvalue, cohens_d,
+    )
+
+
+def analyze_circuits(benchmark_data: Dict[str, Dict[str, np.ndarray]]) -> List[StatisticalResult]:
+    """Analyze all circuits at once on stacked (circuits, runs) arrays
+
+    Falls back to per-circuit analysis on a thread pool when the circuits
+    have different run counts and cannot be stacked.
+    """
+    names = list(benchmark_data)
+    if len({len(benchmark_data[c]["baseline"]) for c in names}) != 1:
+        # Each circuit is independent NumPy/SciPy work on its own arrays,
+        # so threads overlap it without pickling anything. map keeps input order.
+        with ThreadPoolExecutor(max_workers=min(len(names), os.cpu_count() or 1) or 1) as ex:
+            return list(ex.map(lambda item: analyze_circuit(*item), benchmark_data.items()))
+
+    baselines = np.stack([benchmark_data[c]["baseline"] for c in names])
+    optimized = np.stack([benchmark_data[c]["optimized"] for c in names])
+    improvements = np.stack([benchmark_data[c]["improvement"] for c in names])
+    n = baselines.shape[1]
+
+    # One reduction per quantity across every circuit
+    baseline_stats = _stats_pass(baselines)
+    optimized_stats = _stats_pass(optimized)
+    improvement_stats = _stats_pass(improvements)
+
+    t_stats, t_pvalues = stats.ttest_rel(optimized, baselines, axis=1, alternative='greater')
+
+    # Row by row: a batched wilcoxon picks one exact/approx method for the whole
+    # stack, so one row with zero differences would change every row's p-value
+    w_stats, w_pvalues = zip(*(_wilcoxon_greater(row) for row in improvements))
+
+    results = []
+    for i, circuit_name in enumerate(names):
+        results.append(_make_result(
+            circuit_name, n,
+            tuple(v[i] for v in baseline_stats),
+            tuple(v[i] for v in optimized_stats),
+            tuple(v[i] for v in improvement_stats),
+            t_stats[i], t_pvalues[i], w_stats[i], w_pvalues[i],
+            calculate_cohens_d(baselines[i], optimized[i]),
+        ))
+    return results
+
+
 def print_results_table(results: List[StatisticalResult]):
     """Print results as formatted table"""
 
@@ -277,22 +412,37 @@ def print_results_table(results: List[StatisticalResult]):
     print("\nSignificance: *** p<0.001, ** p<0.05, * p<0.10")
 
 
+def _dumps_indented(obj, indent: str) -> bytes:
+    """Pretty-print obj as JSON (2-space indent) for embedding at the given indentation"""
+    if HAS_ORJSON:
+        # OPT_SERIALIZE_NUMPY covers the NumPy scalars coming out of SciPy
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    return data.replace(b"\n", b"\n" + indent.encode())
+
+
 def save_results_json(results: List[StatisticalResult], output_path: Path):
-    """Save results to JSON file"""
-    data = {
-        "analysis": "QNS Statistical Validation",
-        "version": "0.1.0",
-        "results": [asdict(r) for r in results],
-        "summary": {
-            "total_circuits": len(results),
-            "significant_005": sum(1 for r in results if r.is_significant_005),
-            "avg_improvement": float(np.mean([r.improvement_mean for r in results])),
-            "avg_cohens_d": float(np.mean([r.cohens_d for r in results])),
-        }
+    """Save results to JSON file
+
+    Results are written one at a time rather than collected into a single
+    document first; the output matches json.dump(indent=2) of the whole.
+    """
+    summary = {
+        "total_circuits": len(results),
+        "significant_005": sum(1 for r in results if r.is_significant_005),
+        "avg_improvement": float(np.mean([r.improvement_mean for r in results])),
+        "avg_cohens_d": float(np.mean([r.cohens_d for r in results])),
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(b'{\n  "analysis": "QNS Statistical Validation",\n  "version": "0.1.0",\n  "results": [')
+        for i, r in enumerate(results):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(_dumps_indented(asdict(r), "    "))
+        f.write(b'\n  ],\n  "summary": ' if results else b'],\n  "summary": ')
+        f.write(_dumps_indented(summary, "  "))
+        f.write(b'\n}')
 
     print(f"\nResults saved to: {output_path}")
 
@@ -314,15 +464,13 @@ def main():
         benchmark_data = simulate_benchmark_data(args.runs)
     else:
         print("Running Rust benchmarks (this may take a while)...")
-        # For now, use simulated data as placeholder
-        # In production, this would call run_rust_benchmark()
-        benchmark_data = simulate_benchmark_data(args.runs)
+        benchmark_data = run_rust_benchmark(args.runs)
+        if not benchmark_data:
+            print("Rust benchmarks unavailable; using simulated data instead", file=sys.stderr)
+            benchmark_data = simulate_benchmark_data(args.runs)
 
-    # Analyze each circuit
-    results = []
-    for circuit_name, runs in benchmark_data.items():
-        result = analyze_circuit(circuit_name, runs)
-        results.append(result)
+    # Analyze all circuits
+    results = analyze_circuits(benchmark_data)
 
     # Print results
     print_results_table(results)